@@ -0,0 +1,80 @@
+"""
+엑셀 리더 벤치마크: pd.ExcelFile 전체 로드 vs openpyxl 스트리밍(조기 종료 포함)
+
+    python benchmarks/reader_benchmark.py EXCEL.zip --repeat 3
+
+각 리더로 모든 파일을 읽어 파일당 평균 시간을 출력하고,
+리더가 만든 격자(열 이름 포함)가 pandas 격자와 같은지 확인합니다.
+조기 종료 리더는 읽은 행까지만 비교합니다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deunggi.engine import extract_excel_zip, find_excel_files  # noqa: E402
+from deunggi.reader import READERS  # noqa: E402
+
+
+def load_paths(source, work_dir):
+    if os.path.isdir(source):
+        return find_excel_files(source)
+    return extract_excel_zip(source, work_dir)
+
+
+def time_reader(read, paths, repeat):
+    best = None
+    frames = []
+    for _ in range(repeat):
+        frames = []
+        start = time.perf_counter()
+        for path in paths:
+            try:
+                frames.append(read(path))
+            except Exception as e:
+                frames.append(type(e).__name__)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, frames
+
+
+def same_grid(a, b):
+    """b가 a와 같은지 (b가 더 짧으면 a의 앞부분과 비교)"""
+    if isinstance(a, str) or isinstance(b, str):
+        return isinstance(a, str) and isinstance(b, str)
+    return list(a.columns) == list(b.columns) and a.iloc[:len(b)].equals(b)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엑셀 리더 벤치마크")
+    parser.add_argument("source", help="엑셀 ZIP 또는 .xlsx 폴더")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        paths = load_paths(args.source, work_dir)
+        if not paths:
+            sys.exit("엑셀 파일(.xlsx)이 없습니다.")
+        print(f"파일 {len(paths)}개, 반복 {args.repeat}회 중 최솟값")
+
+        results = {}
+        for name, read in READERS.items():
+            elapsed, frames = time_reader(read, paths, args.repeat)
+            results[name] = frames
+            print(f"  {name:<15} {elapsed:8.2f}s  파일당 {elapsed / len(paths) * 1000:7.1f}ms")
+
+        baseline = results["pandas"]
+        sizes = [len(df) for df in baseline if not isinstance(df, str)]
+        if sizes:
+            print(f"  파일당 평균 {sum(sizes) / len(sizes):.0f}행 (최대 {max(sizes)}행)")
+        for name, frames in results.items():
+            mismatches = sum(not same_grid(a, b) for a, b in zip(baseline, frames))
+            read_rows = sum(len(df) for df in frames if not isinstance(df, str))
+            print(f"  {name:<15} 읽은 행 {read_rows}개, pandas 격자와 다른 파일: {mismatches}개")
+
+
+if __name__ == "__main__":
+    main()
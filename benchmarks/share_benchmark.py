@@ -0,0 +1,138 @@
+"""
+지분 문자열 처리 벤치마크: 표기별 정규식 순차 검색(기존) vs ShareParser 단일 패턴
+
+    python benchmarks/share_benchmark.py EXCEL.zip --repeat 5
+
+등기부의 소유지분현황 섹션에서 최종지분·주소·등기명의인 셀 문자열을 모아
+is_jibun_pattern / extract_jibun / convert_jibun_to_decimal을 두 방식으로 실행하고
+문자열당 평균 시간과 결과가 다른 문자열 수를 출력합니다.
+source를 생략하면 내장 예시 문자열만 사용합니다.
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deunggi.engine import SZJ_COLUMNS, extract_excel_zip, find_excel_files  # noqa: E402
+from deunggi.extract import (  # noqa: E402
+    REGISTRY_SECTIONS, convert_jibun_to_decimal, convert_jibun_to_decimal_by_rules,
+    extract_jibun, extract_named_cols, extract_sections, is_jibun_pattern,
+)
+from deunggi.reader import read_registry_sheet  # noqa: E402
+
+SAMPLES = [
+    "2분의 1", "3분의 1", "1/2", "공유1/3", "50%", "33.3 %", "단독소유", "단독",
+    "10139.94분의845.0298", "10139.94분 의 845.0298", "서울특별시 강남구 역삼동 123",
+    "홍길동", "공유자지분 5분의 2", "", "경기도 수원시 팔달구 1/2", "0/0",
+]
+
+
+# 기존 구현 (호출할 때마다 표기별 패턴을 만들어 차례로 검색)
+def legacy_patterns():
+    return [
+        re.compile(r'(?:공유)?[\d]+[/][\d]+'),
+        re.compile(r'[\d]+[.]?[\d]*\s*%'),
+        re.compile(r'[\d]+\.?[\d]*\s*분\s*의\s*[\d]+\.?[\d]*'),
+        re.compile(r'[\d]+\.?[\d]*분의[\d]+\.?[\d]*'),
+    ]
+
+
+def legacy_is_jibun_pattern(text):
+    if not isinstance(text, str) or not text.strip():
+        return False
+    if "단독소유" in text or "단독" in text:
+        return True
+    return any(re.search(pattern, text) for pattern in legacy_patterns())
+
+
+def legacy_extract_jibun(text):
+    if not isinstance(text, str):
+        return ""
+    if "단독소유" in text or ("단독" in text and len(text.strip()) < 10):
+        return "단독소유"
+    for pattern in legacy_patterns():
+        match = re.search(pattern, text)
+        if match:
+            return match.group(0)
+    return ""
+
+
+def legacy_convert_jibun_to_decimal(text):
+    if not text or pd.isna(text):
+        return None
+    return convert_jibun_to_decimal_by_rules(str(text).strip())
+
+
+def collect_texts(source, work_dir):
+    """소유지분현황 섹션의 최종지분·주소·등기명의인 셀 문자열"""
+    paths = find_excel_files(source) if os.path.isdir(source) else extract_excel_zip(source, work_dir)
+    texts = []
+    for path in paths:
+        try:
+            section, found = extract_sections(read_registry_sheet(path), REGISTRY_SECTIONS)["소유지분현황"]
+            if not found:
+                continue
+            szj = extract_named_cols(section, SZJ_COLUMNS)
+        except Exception:
+            continue
+        for column in ("최종지분", "주소", "등기명의인"):
+            if column in szj:
+                texts.extend(szj[column].astype(str))
+    return texts
+
+
+def time_calls(functions, texts, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            for function in functions:
+                try:
+                    function(text)
+                except Exception:
+                    pass
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def result_of(function, text):
+    try:
+        return function(text)
+    except Exception as e:
+        return type(e).__name__
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지분 문자열 처리 벤치마크")
+    parser.add_argument("source", nargs="?", help="엑셀 ZIP 또는 .xlsx 폴더 (생략 시 내장 예시)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        texts = collect_texts(args.source, work_dir) if args.source else []
+    texts += SAMPLES
+    jibun_texts = sum(1 for text in texts if legacy_extract_jibun(text))
+    print(f"문자열 {len(texts)}개 (지분 표기 포함 {jibun_texts}개), 반복 {args.repeat}회 중 최솟값")
+
+    pairs = [
+        ("is_jibun_pattern", legacy_is_jibun_pattern, is_jibun_pattern),
+        ("extract_jibun", legacy_extract_jibun, extract_jibun),
+        ("convert_jibun_to_decimal", legacy_convert_jibun_to_decimal, convert_jibun_to_decimal),
+    ]
+    for name, legacy, current in pairs:
+        legacy_time = time_calls([legacy], texts, args.repeat)
+        current_time = time_calls([current], texts, args.repeat)
+        mismatches = sum(result_of(legacy, text) != result_of(current, text) for text in texts)
+        print(f"  {name:<26} 기존 {legacy_time / len(texts) * 1e6:6.2f}us  "
+              f"ShareParser {current_time / len(texts) * 1e6:6.2f}us  결과가 다른 문자열: {mismatches}개")
+
+
+if __name__ == "__main__":
+    main()
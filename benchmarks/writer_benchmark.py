@@ -0,0 +1,76 @@
+"""
+결과 워크북 작성 벤치마크: 작성 방식(WRITERS)별 저장 시간과 파일 크기
+
+    python benchmarks/writer_benchmark.py EXCEL.zip --copies 50 --repeat 1
+
+엑셀 ZIP을 한 번 파싱한 결과를 copies번 이어 붙여 큰 배치를 만들고,
+각 작성 방식으로 통합 워크북을 저장한 시간(최솟값), 파일 크기, 워크북 스타일 수를 출력합니다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deunggi.engine import extract_excel_zip, find_excel_files, process_batch  # noqa: E402
+from deunggi.writer import WRITERS  # noqa: E402
+
+
+def load_paths(source, work_dir):
+    if os.path.isdir(source):
+        return find_excel_files(source)
+    return extract_excel_zip(source, work_dir)
+
+
+def style_counts(path):
+    """styles.xml의 셀 서식(cellXfs)·테두리(borders) 항목 수"""
+    with zipfile.ZipFile(path) as z:
+        styles = z.read("xl/styles.xml").decode("utf-8")
+    counts = {}
+    for tag in ("cellXfs", "borders", "cellStyles"):
+        start = styles.find(f"<{tag} count=\"")
+        counts[tag] = int(styles[start + len(tag) + 9:styles.index('"', start + len(tag) + 9)]) if start >= 0 else 0
+    return counts
+
+
+def time_writer(write, lists, path, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        write(*lists, path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="결과 워크북 작성 벤치마크")
+    parser.add_argument("source", help="엑셀 ZIP 또는 .xlsx 폴더")
+    parser.add_argument("--copies", type=int, default=20, help="파싱 결과를 이어 붙일 횟수")
+    parser.add_argument("--repeat", type=int, default=1, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument("--writer", action="append", choices=list(WRITERS), help="측정할 작성 방식 (기본: 전체)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        paths = load_paths(args.source, os.path.join(work_dir, "excel"))
+        if not paths:
+            sys.exit("엑셀 파일(.xlsx)이 없습니다.")
+        result = process_batch(paths)
+        lists = [result.szj_list * args.copies, result.syg_list * args.copies, result.djg_list * args.copies]
+        rows = [sum(len(df) for df in data) for data in lists]
+        print(f"파일 {len(paths)}개 x {args.copies} → 행 {rows[0]} / {rows[1]} / {rows[2]} (시트별), "
+              f"반복 {args.repeat}회 중 최솟값")
+
+        for name in args.writer or list(WRITERS):
+            path = os.path.join(work_dir, f"{name}.xlsx")
+            elapsed = time_writer(WRITERS[name], lists, path, args.repeat)
+            counts = style_counts(path)
+            print(f"  {name:<10} {elapsed:8.2f}s  {os.path.getsize(path) / 1024:9.1f}KB  "
+                  f"셀 서식 {counts['cellXfs']}개 / 테두리 {counts['borders']}개 / 이름 있는 스타일 {counts['cellStyles']}개")
+
+
+if __name__ == "__main__":
+    main()
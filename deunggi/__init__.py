@@ -0,0 +1,15 @@
+"""
+(주)건화 등기부등본 통합분석 엔진
+"""
+from .engine import (
+    ParsedRegistry,
+    ConsolidatedResult,
+    process_workbook,
+    process_batch,
+    extract_excel_zip,
+    write_result_zip,
+    EXCEL_RESULT_NAME,
+    PDF_RESULT_NAME,
+)
+from .pdf import extract_and_process_pdf_zip, process_pdf_files
+from .summary import RunSummary
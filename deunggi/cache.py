@@ -0,0 +1,324 @@
+"""
+디스크 캐시
+
+ResultCache: 통합 결과 ZIP 캐시
+    같은 EXCEL.zip(과 PDF.zip)을 다시 분석하면 파싱·스타일 적용을 모두 건너뛰고
+    저장해 둔 통합_결과.zip을 바로 돌려줍니다.
+    - 키: 업로드 ZIP 내용의 SHA-256 (+ 결과에 영향을 주는 옵션(시트 리더 포함), CACHE_VERSION, 결과 모듈 소스 해시)
+ParseCache: 엑셀 파일별 파싱 결과 캐시 (SQLite)
+    다른 ZIP에 같은 등기부 파일이 다시 들어 있으면 그 파일의 파싱을 건너뜁니다.
+    - 값: 파싱 결과를 JSON으로 저장 (pickle을 쓰지 않으므로 캐시 파일을 읽어도 코드가 실행되지 않음)
+    - 키: 엑셀 파일 내용의 SHA-256 (+ CACHE_VERSION, 파싱 모듈 소스 해시, 시트 리더)
+    - 오류로 끝난 파일(error_type이 있는 결과)은 저장하지 않고 다음 실행에서 다시 파싱
+
+두 캐시 모두 최근 사용 순(LRU)으로 정리하며 용량이 max_bytes를 넘으면 오래된 항목부터 삭제
+캐시 폴더(기본 ~/.cache/deunggi)는 이 사용자만 쓸 수 있어야 합니다 (private_dir).
+"""
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import time
+from dataclasses import fields
+from functools import lru_cache
+
+import pandas as pd
+
+# 결과 형식(시트 구성, 추출 규칙 등)이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = "1"
+
+# 사용자별 폴더 (공용 임시 폴더는 다른 사용자가 먼저 만들어 항목을 바꿔 넣을 수 있음)
+DEFAULT_CACHE_DIR = os.environ.get(
+    "DEUNGGI_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "deunggi")
+)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_PARSE_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, "parse_cache.sqlite3")
+DEFAULT_PARSE_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+# 파싱 결과를 만드는 모듈 - 소스가 바뀌면 파싱 캐시 키가 바뀜 (CACHE_VERSION을 올리지 않아도 됨)
+PARSER_MODULES = [
+    "engine.py", "extract.py", "document.py", "layout.py", "reader.py", "share.py", "landtype.py",
+]
+# 통합 결과 ZIP을 만드는 모듈 (파싱 모듈 + 작성·내보내기·병합·PDF·통계) - 소스가 바뀌면 결과 캐시 키가 바뀜
+RESULT_MODULES = PARSER_MODULES + ["writer.py", "export.py", "merge.py", "pdf.py", "summary.py"]
+
+
+def private_dir(path):
+    """
+    캐시 폴더를 만들고(권한 0700) 경로를 반환
+    다른 사용자 소유이거나 다른 사용자도 쓸 수 있는 폴더면 PermissionError
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.stat(path)
+    # 사용자 ID가 없는 OS(Windows)는 사용자 프로필 폴더 권한에 맡김
+    if hasattr(os, "getuid") and (info.st_uid != os.getuid() or info.st_mode & 0o022):
+        raise PermissionError(
+            f"캐시 폴더가 다른 사용자 소유이거나 다른 사용자도 쓸 수 있습니다: {path} "
+            f"(DEUNGGI_CACHE_DIR로 이 사용자만 쓰는 폴더를 지정하거나 캐시를 끄세요)"
+        )
+    return path
+
+
+def update_hash(h, source, chunk_size=1024 * 1024):
+    """파일 경로 또는 파일 객체(Streamlit UploadedFile 등) 내용을 해시에 추가"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                h.update(chunk)
+        return
+    position = source.tell()
+    source.seek(0)
+    for chunk in iter(lambda: source.read(chunk_size), b""):
+        h.update(chunk)
+    source.seek(position)
+
+
+@lru_cache(maxsize=None)
+def source_fingerprint(modules):
+    """패키지 모듈(파일 이름 튜플) 소스의 SHA-256 (모듈 목록마다 프로세스당 한 번 계산)"""
+    h = hashlib.sha256()
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in modules:
+        h.update(name.encode("utf-8") + b"\0")
+        update_hash(h, os.path.join(package_dir, name))
+    return h.hexdigest()
+
+
+def parser_fingerprint():
+    """PARSER_MODULES 소스의 SHA-256"""
+    return source_fingerprint(tuple(PARSER_MODULES))
+
+
+def result_fingerprint():
+    """RESULT_MODULES 소스의 SHA-256"""
+    return source_fingerprint(tuple(RESULT_MODULES))
+
+
+def file_cache_key(path, reader=None):
+    """엑셀 파일 내용, 파싱 코드, 시트 리더로 파싱 캐시 키 생성"""
+    h = hashlib.sha256()
+    h.update(f"v{CACHE_VERSION}\0{parser_fingerprint()}\0{reader}\0".encode())
+    update_hash(h, path)
+    return h.hexdigest()
+
+
+def result_cache_key(excel_zip, pdf_zip=None, options=None):
+    """업로드 ZIP 내용, 옵션(deunggi.engine.output_options), 결과 코드로 캐시 키 생성"""
+    h = hashlib.sha256()
+    h.update(f"v{CACHE_VERSION}\0{result_fingerprint()}\0".encode())
+    update_hash(h, excel_zip)
+    h.update(b"\0pdf\0")
+    if pdf_zip is not None:
+        update_hash(h, pdf_zip)
+    h.update(json.dumps(options or {}, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    return h.hexdigest()
+
+
+class ResultCache:
+    """통합 결과 ZIP과 처리 통계(meta)를 키별로 저장하는 디스크 캐시"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = private_dir(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _paths(self, key):
+        return os.path.join(self.cache_dir, f"{key}.zip"), os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """(결과 ZIP 경로, meta dict) 또는 None"""
+        zip_path, meta_path = self._paths(key)
+        if not (os.path.exists(zip_path) and os.path.exists(meta_path)):
+            return None
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # 최근 사용 시각 갱신 (LRU)
+        os.utime(meta_path)
+        return zip_path, meta
+
+    def put(self, key, result_zip_path, meta):
+        """결과 ZIP을 복사해 저장하고 용량 제한에 맞춰 오래된 항목 삭제"""
+        zip_path, meta_path = self._paths(key)
+        tmp_zip = zip_path + ".tmp"
+        shutil.copyfile(result_zip_path, tmp_zip)
+        os.replace(tmp_zip, zip_path)
+        tmp_meta = meta_path + ".tmp"
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_meta, meta_path)
+        self.evict(keep=key)
+        return zip_path
+
+    def entries(self):
+        """[(마지막 사용 시각, 크기, 키)] - 오래된 순"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            key = name[:-len(".json")]
+            zip_path, meta_path = self._paths(key)
+            try:
+                size = os.path.getsize(zip_path) + os.path.getsize(meta_path)
+                entries.append((os.path.getmtime(meta_path), size, key))
+            except OSError:
+                continue
+        entries.sort()
+        return entries
+
+    def evict(self, keep=None):
+        """전체 용량이 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목 삭제 (keep 키는 유지)"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in entries:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+
+
+def frame_to_json(df):
+    """DataFrame → JSON 값 (열 이름과 그 dtype, 열별 dtype·값, 기본 인덱스가 아니면 인덱스)"""
+    default_index = df.index.equals(pd.RangeIndex(len(df)))
+    return {
+        "columns": df.columns.tolist(),
+        "columns_dtype": str(df.columns.dtype),
+        "dtypes": [str(dtype) for dtype in df.dtypes],
+        "rows": len(df),
+        "index": None if default_index else df.index.tolist(),
+        "data": [df.iloc[:, i].tolist() for i in range(df.shape[1])],
+    }
+
+
+def frame_from_json(value):
+    """frame_to_json 결과 → DataFrame (object가 아닌 열은 저장한 dtype으로 되돌림)"""
+    index = pd.RangeIndex(value["rows"]) if value["index"] is None else pd.Index(value["index"])
+    df = pd.DataFrame(dict(enumerate(value["data"])), index=index, dtype=object)
+    df.columns = pd.Index(value["columns"], dtype=value["columns_dtype"])
+    for i, dtype in enumerate(value["dtypes"]):
+        if dtype != "object":
+            df.isetitem(i, df.iloc[:, i].astype(dtype))
+    return df
+
+
+# ParsedRegistry 필드 중 DataFrame인 것
+FRAME_FIELDS = ("szj", "syg", "djg")
+
+
+def registry_to_json(registry):
+    """ParsedRegistry → JSON 문자열 (path 제외), JSON으로 나타낼 수 없는 값이 있으면 TypeError/ValueError"""
+    values = {f.name: getattr(registry, f.name) for f in fields(registry) if f.name != "path"}
+    for name in FRAME_FIELDS:
+        if values[name] is not None:
+            values[name] = frame_to_json(values[name])
+    return json.dumps(values, ensure_ascii=False)
+
+
+def registry_from_json(payload, path):
+    # engine이 이 모듈을 import하므로 함수 안에서 import
+    from .engine import ParsedRegistry
+
+    values = json.loads(payload)
+    for name in FRAME_FIELDS:
+        if values[name] is not None:
+            values[name] = frame_from_json(values[name])
+    return ParsedRegistry(path=path, **values)
+
+
+class ParseCache:
+    """
+    엑셀 파일별 파싱 결과(ParsedRegistry) SQLite 캐시
+    소유지분현황/소유권사항/저당권사항 행과 식별자·지목·토지면적을 파일 내용 해시로 저장 (JSON)
+    hits/misses는 이 객체를 만든 뒤의 조회 횟수
+    """
+
+    def __init__(self, path=DEFAULT_PARSE_CACHE_PATH, max_bytes=DEFAULT_PARSE_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if os.path.dirname(path):
+            private_dir(os.path.dirname(path))
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS parsed_registry ("
+            " key TEXT PRIMARY KEY,"
+            " payload BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_parsed_registry_last_used ON parsed_registry(last_used)")
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, key, path):
+        """캐시된 ParsedRegistry (path는 현재 파일 경로로 교체) 또는 None"""
+        row = self.conn.execute("SELECT payload FROM parsed_registry WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        try:
+            registry = registry_from_json(row[0], path)
+        except (ValueError, TypeError, KeyError):
+            # 예전 형식(pickle) 등 읽을 수 없는 항목은 삭제하고 다시 파싱
+            self.conn.execute("DELETE FROM parsed_registry WHERE key = ?", (key,))
+            self.conn.commit()
+            self.misses += 1
+            return None
+        self.conn.execute("UPDATE parsed_registry SET last_used = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return registry
+
+    def put(self, key, registry):
+        """파싱 결과 저장 - error_type이 있으면(읽기 오류 등 일시적일 수 있는 실패) 저장하지 않음"""
+        if registry.error_type:
+            return
+        try:
+            payload = registry_to_json(registry)
+        except (TypeError, ValueError):
+            # JSON으로 나타낼 수 없는 값(날짜 등)이 있으면 캐시하지 않음
+            return
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO parsed_registry (key, payload, size, created, last_used) VALUES (?, ?, ?, ?, ?)",
+            (key, payload, len(payload.encode("utf-8")), now, now)
+        )
+
+    def commit(self):
+        self.conn.commit()
+
+    def evict(self):
+        """저장 용량이 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목 삭제"""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM parsed_registry").fetchone()[0]
+        if total > self.max_bytes:
+            doomed = []
+            for key, size in self.conn.execute("SELECT key, size FROM parsed_registry ORDER BY last_used"):
+                if total <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                total -= size
+            self.conn.executemany("DELETE FROM parsed_registry WHERE key = ?", doomed)
+            self.evictions += len(doomed)
+        self.conn.commit()
+
+    def stats(self):
+        """캐시 통계: 조회 적중/실패, 저장 항목 수와 용량, 삭제 수"""
+        entries, total = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM parsed_registry").fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "bytes": total,
+            "evictions": self.evictions,
+        }
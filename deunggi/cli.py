@@ -0,0 +1,306 @@
+"""
+명령줄 일괄 처리 (Streamlit 없이 실행)
+
+    python -m deunggi batch --excel EXCEL.zip --pdf PDF.zip --out 통합_결과.zip --workers 8
+    python -m deunggi batch --excel 추가분.zip --merge-into 이전_통합_결과.zip --out 통합_결과.zip
+    python -m deunggi search --owner 홍길동
+
+batch는 단계별 소요 시간을 출력하고, 실패한 파일이 있으면 종료 코드 1을 반환합니다.
+search는 batch --store로 쌓은 SQLite 저장소에서 행을 찾습니다.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+
+from .cache import DEFAULT_CACHE_DIR, ParseCache, ResultCache, private_dir, result_cache_key
+from .engine import extract_excel_zip, output_options, process_batch, write_result_zip
+from .export import EXPORTERS, check_formats
+from .merge import load_consolidated, merge_existing, merge_source_key
+from .pdf import extract_and_process_pdf_zip
+from .reader import DEFAULT_READER, READERS
+from .store import DEFAULT_STORE_PATH, STORE_TABLES, RegistryStore, batch_key
+from .summary import RunSummary
+from .writer import DEFAULT_MAX_ROWS, DEFAULT_WRITER, WRITERS, check_max_rows
+
+
+@contextmanager
+def stage(label, timings):
+    """단계별 소요 시간 측정 및 출력"""
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    timings.append((label, elapsed))
+    print(f"[{label}] {elapsed:.2f}s", flush=True)
+
+
+def print_progress(label):
+    """progress(done, total) 콜백: 약 10% 단위로 진행률 출력"""
+    def update(done, total):
+        step = max(1, total // 10)
+        if done % step == 0 or done == total:
+            print(f"  {label} {done}/{total} ({done / total:.1%})", file=sys.stderr, flush=True)
+    return update
+
+
+def print_summary(title, summary):
+    """성공/실패 통계 출력, 실패 사례는 stderr"""
+    print(f"{title}: 성공 {summary.success_count} / 실패 {summary.failure_count} / 전체 {summary.total} "
+          f"(성공률 {summary.success_rate:.1f}%)")
+    for error_type, count in summary.error_summary.items():
+        print(f"  - {error_type}: {count}개", file=sys.stderr)
+    for sample in summary.failed_samples:
+        print(f"    {sample}", file=sys.stderr)
+
+
+def print_layouts(layouts):
+    """레이아웃 지문 통계 출력, 헤더에서 찾지 못한 열이 있는 레이아웃은 검토용으로 stderr"""
+    if not layouts:
+        return
+    incomplete = {fingerprint: layout for fingerprint, layout in layouts.items() if layout["missing"]}
+    print(f"헤더 레이아웃: {len(layouts)}종 (열 누락 {len(incomplete)}종)")
+    for fingerprint, layout in incomplete.items():
+        print(f"  - {fingerprint} 파일 {layout['files']}개 (예: {layout['sample']}) "
+              f"누락: {', '.join(layout['missing'])}", file=sys.stderr)
+
+
+def print_shards(manifest):
+    """행 예산을 넘어 나눈 시트 출력"""
+    if not manifest:
+        return
+    split_sources = {part["source"] for part in manifest["sheets"] if part["part"] > 1}
+    print(f"시트 분할 (시트당 최대 {manifest['max_rows']}행, 헤더 포함):")
+    for part in manifest["sheets"]:
+        if part["source"] in split_sources:
+            split = " (한 토지주소를 나눔)" if part["parcel_split"] else ""
+            print(f"  - {part['sheet']}: {part['rows']}행 {part['first_address']} ~ {part['last_address']}{split}")
+
+
+def batch_stored(path, key):
+    store = RegistryStore(path)
+    try:
+        return store.has_batch(key)
+    finally:
+        store.close()
+
+
+def run_batch(args):
+    timings = []
+    failures = 0
+    # 저장소 배치 키: 엑셀 ZIP 내용 (같은 ZIP은 한 번만 저장)
+    store_key = batch_key(args.excel) if args.store else None
+
+    # 캐시 폴더를 안전하게 쓸 수 없으면(다른 사용자 소유 등) 처리 전에 종료
+    if not (args.no_cache and args.no_parse_cache):
+        try:
+            private_dir(DEFAULT_CACHE_DIR)
+        except PermissionError as e:
+            print(e, file=sys.stderr)
+            return 2
+
+    # 같은 ZIP을 이미 처리했으면 저장된 결과를 복사
+    cache = cache_key = None
+    if not args.no_cache:
+        cache = ResultCache()
+        with stage("캐시 확인", timings):
+            merge_key = merge_source_key(args.merge_into) if args.merge_into else None
+            cache_key = result_cache_key(args.excel, args.pdf,
+                                         output_options(args.writer, args.max_rows, args.export, merge_key,
+                                                        args.reader))
+            cached = cache.get(cache_key)
+        if cached and store_key is not None and not batch_stored(args.store, store_key):
+            # 저장소에 아직 없는 배치는 행을 저장하도록 다시 파싱
+            cached = None
+        if cached:
+            cached_zip, meta = cached
+            shutil.copyfile(cached_zip, args.out)
+            print_summary("엑셀 파일 변환 결과 (캐시)", RunSummary(**meta["excel"]))
+            failures += meta["excel"]["failure_count"] + (meta["excel"]["total"] == 0)
+            if meta.get("pdf"):
+                print_summary("PDF 파일명 변경 결과 (캐시)", RunSummary(**meta["pdf"]))
+                failures += meta["pdf"]["failure_count"]
+            print(f"[전체] {sum(elapsed for _, elapsed in timings):.2f}s → {args.out}")
+            return 1 if failures else 0
+
+    # 증분 병합: 기존 통합 결과를 먼저 읽어 둠 (읽을 수 없으면 파싱 전에 종료)
+    tables = None
+    if args.merge_into:
+        try:
+            with stage("기존 결과 읽기", timings):
+                tables = load_consolidated(args.merge_into)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 2
+        print("기존 결과: " + " / ".join(f"{name} {len(df)}행" for name, df in tables.items()))
+
+    pdf_summary = None
+    with tempfile.TemporaryDirectory() as work_dir:
+        with stage("엑셀 압축 해제", timings):
+            excel_files = extract_excel_zip(args.excel, os.path.join(work_dir, "excel"))
+        if not excel_files:
+            print("업로드된 ZIP 파일에 Excel 파일(.xlsx)이 없습니다.", file=sys.stderr)
+            failures += 1
+
+        parse_cache = None if args.no_parse_cache else ParseCache()
+        with stage("엑셀 파싱", timings):
+            result = process_batch(excel_files, progress=print_progress("엑셀 처리"), workers=args.workers,
+                                   parse_cache=parse_cache, reader=args.reader)
+        if parse_cache is not None:
+            stats = parse_cache.stats()
+            parse_cache.close()
+            print(f"파일별 캐시: 적중 {stats['hits']} / 새로 파싱 {stats['misses']} / "
+                  f"저장 {stats['entries']}개 {stats['bytes'] / 1024 / 1024:.1f}MB / 삭제 {stats['evictions']}")
+        plan_stats = result.header_plan_stats
+        lookups = plan_stats["hits"] + plan_stats["misses"]
+        if lookups:
+            print(f"헤더 배치 캐시: 적중 {plan_stats['hits']} / 조회 {lookups} ({plan_stats['hits'] / lookups:.1%})")
+        print_layouts(result.layouts)
+        if args.layout_report:
+            with open(args.layout_report, "w", encoding="utf-8") as f:
+                json.dump(result.layouts, f, ensure_ascii=False, indent=2)
+        print_summary("엑셀 파일 변환 결과", result.summary)
+        failures += result.summary.failure_count
+
+        if args.store:
+            with stage("저장소 저장", timings):
+                store = RegistryStore(args.store)
+                batch_id = store.add_batch(result, os.path.basename(args.excel), store_key)
+                store.close()
+            print(f"저장소: 배치 {batch_id} → {args.store}")
+
+        if tables is not None:
+            with stage("기존 결과 병합", timings):
+                replaced = merge_existing(result, tables)
+            print(f"토지주소 {len(replaced)}개의 기존 행을 새 파일 결과로 교체")
+
+        excel_result_path = os.path.join(work_dir, "excel_result.xlsx")
+        with stage("엑셀 저장", timings):
+            manifest = result.write_workbook(excel_result_path, writer=args.writer, max_rows=args.max_rows)
+        print_shards(manifest)
+
+        export_paths = []
+        if args.export:
+            with stage("표 데이터 내보내기", timings):
+                export_paths = result.export_tables(os.path.join(work_dir, "export"), args.export)
+
+        pdf_result_path = None
+        if args.pdf:
+            pdf_dir = os.path.join(work_dir, "pdf")
+            os.makedirs(pdf_dir)
+            pdf_result_path = os.path.join(work_dir, "processed_result_pdf.zip")
+            with stage("PDF 파일명 변경", timings):
+                pdf_summary = extract_and_process_pdf_zip(
+                    args.pdf, pdf_dir, pdf_result_path,
+                    progress=print_progress("PDF 처리"), workers=args.workers
+                )
+            print_summary("PDF 파일명 변경 결과", pdf_summary)
+            failures += pdf_summary.failure_count
+
+        with stage("통합 결과 ZIP 작성", timings):
+            write_result_zip(excel_result_path, pdf_result_path, args.out, manifest, export_paths)
+
+    if cache is not None:
+        cache.put(cache_key, args.out, {
+            "excel": asdict(result.summary),
+            "pdf": asdict(pdf_summary) if pdf_summary else None,
+        })
+
+    print(f"[전체] {sum(elapsed for _, elapsed in timings):.2f}s → {args.out}")
+    return 1 if failures else 0
+
+
+def run_search(args):
+    # 없는 경로면 빈 저장소를 새로 만들지 않고 종료
+    if not os.path.exists(args.store):
+        print(f"저장소가 없습니다: {args.store} (batch --store로 먼저 저장하세요)", file=sys.stderr)
+        return 2
+    store = RegistryStore(args.store)
+    try:
+        rows = store.search(args.table, address=args.address, owner=args.owner, mortgagee=args.mortgagee,
+                            exact=args.exact, limit=args.limit)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    finally:
+        store.close()
+    if args.csv:
+        rows.to_csv(args.csv, index=False, encoding="utf-8-sig")
+    else:
+        print(rows.to_string(index=False))
+    print(f"{STORE_TABLES[args.table][0]}: {len(rows)}행", file=sys.stderr)
+    return 0
+
+
+def max_rows_arg(value):
+    try:
+        max_rows = int(value)
+        check_max_rows(max_rows)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return max_rows
+
+
+def existing_path(value):
+    if not os.path.exists(value):
+        raise argparse.ArgumentTypeError(f"경로가 없습니다: {value}")
+    return value
+
+
+def export_arg(value):
+    try:
+        check_formats([value])
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m deunggi", description="(주)건화 등기부등본 통합분석기")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="엑셀/PDF ZIP을 일괄 처리해 통합 결과 ZIP 작성")
+    batch.add_argument("--excel", required=True, help="등기부등본 엑셀(.xlsx) ZIP")
+    batch.add_argument("--pdf", help="등기부등본 PDF ZIP (선택)")
+    batch.add_argument("--out", default="통합_결과.zip", help="통합 결과 ZIP 경로 (기본: 통합_결과.zip)")
+    batch.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                       help="병렬 처리 프로세스 수 (기본: CPU 코어 수)")
+    batch.add_argument("--reader", choices=list(READERS), default=DEFAULT_READER,
+                       help=f"엑셀 읽기 방식 (기본: {DEFAULT_READER})")
+    batch.add_argument("--writer", choices=list(WRITERS), default=DEFAULT_WRITER,
+                       help=f"결과 워크북 작성 방식 (기본: {DEFAULT_WRITER}, data-only: 서식 없이 값만)")
+    batch.add_argument("--export", action="append", type=export_arg, default=[], metavar="{" + ",".join(EXPORTERS) + "}",
+                       help="시트별 합친 표를 서식 없이 함께 저장할 형식 (여러 번 지정 가능, parquet/feather는 pyarrow 필요)")
+    batch.add_argument("--max-rows", type=max_rows_arg, default=DEFAULT_MAX_ROWS,
+                       help=f"시트 1개의 최대 행 수, 넘으면 토지주소 단위로 이어지는 시트로 나눔 (기본: {DEFAULT_MAX_ROWS})")
+    batch.add_argument("--merge-into", metavar="EXISTING", type=existing_path,
+                       help="이전 통합 결과(.xlsx, 통합_결과.zip 또는 표_데이터 폴더)에 이번 ZIP의 파일만 파싱해 병합 "
+                            "(같은 토지주소의 기존 행은 교체)")
+    batch.add_argument("--store", nargs="?", const=DEFAULT_STORE_PATH,
+                       help=f"파싱한 행을 배치·파일 출처와 함께 SQLite 저장소에 추가 (경로 생략 시 {DEFAULT_STORE_PATH})")
+    batch.add_argument("--no-cache", action="store_true", help="이전 결과 캐시를 사용하지 않음")
+    batch.add_argument("--no-parse-cache", action="store_true", help="엑셀 파일별 파싱 캐시를 사용하지 않음")
+    batch.add_argument("--layout-report", help="헤더 레이아웃 지문별 파일 수·누락 열을 JSON으로 저장할 경로")
+    batch.set_defaults(func=run_batch)
+
+    search = commands.add_parser("search", help="SQLite 저장소에서 토지주소·명의인·근저당권자로 행 검색")
+    search.add_argument("--store", default=DEFAULT_STORE_PATH, help=f"저장소 경로 (기본: {DEFAULT_STORE_PATH})")
+    search.add_argument("--table", choices=list(STORE_TABLES), default="szj",
+                        help="szj: 소유지분현황, syg: 소유권사항, djg: 저당권사항 (기본: szj)")
+    search.add_argument("--address", help="토지주소")
+    search.add_argument("--owner", help="등기명의인 (syg/djg는 대상소유자)")
+    search.add_argument("--mortgagee", help="근저당권자 (djg)")
+    search.add_argument("--exact", action="store_true", help="값이 같은 행만 (기본: 값이 들어 있는 행)")
+    search.add_argument("--limit", type=int, default=1000, help="최대 행 수 (기본: 1000)")
+    search.add_argument("--csv", help="결과를 CSV로 저장할 경로 (생략 시 화면 출력)")
+    search.set_defaults(func=run_search)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
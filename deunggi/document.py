@@ -0,0 +1,56 @@
+"""
+등기부 시트 1개의 행 텍스트 색인
+
+식별자·지목·면적 추출 함수가 같은 행 문자열을 여러 번 다시 만들지 않도록
+행별 텍스트와 주요 위치(요약·고유번호 행)를 한 번만 계산해 둡니다.
+"""
+import re
+
+import pandas as pd
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+class RegistryDocument:
+    """
+    df: 시트 DataFrame (빈 셀은 "")
+    row_texts: 행의 셀을 공백으로 이은 문자열 (" ".join(str(cell) ...))
+    summary_row_idx: "주요 등기사항 요약" 행 위치 (없으면 None)
+    identifier_row_idx: "고유번호" 행 위치 (없으면 None)
+    identifier: extract_identifier 결과 (처음 호출할 때 채움)
+    summary: parse_summary 결과 (처음 호출할 때 채움)
+    """
+
+    def __init__(self, df):
+        self.df = df
+        # df.iloc[i]와 같은 값(같은 dtype 변환)으로 행을 한 번에 꺼냄
+        self.row_texts = [" ".join(str(cell) for cell in row if pd.notna(cell)) for row in df.to_numpy()]
+        self.summary_row_idx = self.find_compact("주요등기사항요약")
+        self.identifier_row_idx = self.find("고유번호")
+        self.identifier = None
+        self.summary = None
+
+    @classmethod
+    def of(cls, df_or_doc):
+        """DataFrame이면 색인을 만들고, 이미 RegistryDocument면 그대로 반환"""
+        return df_or_doc if isinstance(df_or_doc, cls) else cls(df_or_doc)
+
+    def __len__(self):
+        return len(self.row_texts)
+
+    def find(self, text, start=0):
+        """text를 포함하는 첫 행 위치"""
+        for i in range(start, len(self.row_texts)):
+            if text in self.row_texts[i]:
+                return i
+        return None
+
+    def find_compact(self, text, start=0):
+        """공백을 제거한 행 문자열에서 text를 포함하는 첫 행 위치"""
+        # 공백을 지워도 글자는 그대로 남으므로 text의 마지막 글자가 없는 행은 공백 제거 없이 건너뜀
+        last = text[-1:]
+        for i in range(start, len(self.row_texts)):
+            row_text = self.row_texts[i]
+            if last in row_text and text in WHITESPACE_RE.sub("", row_text):
+                return i
+        return None
@@ -0,0 +1,502 @@
+"""
+등기부등본 엑셀 통합 엔진
+
+Streamlit 화면(app.py)과 분리된 처리 로직입니다.
+- process_workbook(path): 엑셀 파일 1개를 파싱해 ParsedRegistry 반환
+- process_batch(paths): 여러 파일을 처리해 ConsolidatedResult 반환
+  (workers > 1이면 프로세스 풀로 병렬 파싱, 결과는 입력 순서대로 병합)
+"""
+import json
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from .extract import (
+    REGISTRY_SECTIONS,
+    extract_identifier, extract_land_area, extract_land_type, extract_sections,
+    extract_named_cols, extract_precise_named_cols, named_cols_plan, precise_cols_plan,
+    is_jibun_pattern, extract_jibun,
+    is_address_pattern, convert_jibun_to_decimal, cached_jibun_decimal,
+    merge_same_row_if_amount_separated, trim_after_reference_note, extract_right_holders,
+)
+from .cache import file_cache_key
+from .document import RegistryDocument
+from .export import export_tables
+from .layout import HEADER_PLANS, ExtractionPlan, layout_fingerprint
+from .reader import DEFAULT_READER, read_registry_sheet
+from .summary import RunSummary
+from .writer import DATA_ONLY_WRITER, DEFAULT_MAX_ROWS, DEFAULT_WRITER, shard_manifest, write_workbook
+
+# 섹션별로 뽑는 열: 소유지분현황 / 소유권사항·을구
+SZJ_COLUMNS = ["등기명의인", "(주민)등록번호", "최종지분", "주소", "순위번호"]
+RIGHTS_COLUMNS = ["순위번호", "등기목적", "접수정보", "주요등기사항", "대상소유자"]
+
+# 통합 결과 ZIP 내부 파일명
+EXCEL_RESULT_NAME = "등기사항_통합_시트별구성.xlsx"
+PDF_RESULT_NAME = "PDF_파일명_일괄변경_결과.zip"
+# 시트를 행 예산으로 나눴을 때 통합 결과 ZIP에 함께 넣는 분할 정보
+MANIFEST_NAME = "시트_분할_정보.json"
+# 표 데이터 내보내기(Parquet/CSV/Feather) 파일을 넣는 통합 결과 ZIP 안의 폴더
+EXPORT_DIR_NAME = "표_데이터"
+
+
+@dataclass
+class ParsedRegistry:
+    """
+    엑셀 파일 1개의 파싱 결과
+    szj/syg/djg는 각 시트에 들어갈 행(DataFrame)이며, 처리 도중 오류가 나면
+    오류 직전까지 만들어진 결과만 채워지고 error_type/error_message가 기록됩니다.
+    """
+    path: str
+    name: str = ""
+    land_type: str = ""
+    land_area: str = ""
+    sections_found: list = None
+    szj: pd.DataFrame = None
+    syg: pd.DataFrame = None
+    djg: pd.DataFrame = None
+    error_type: str = ""
+    error_message: str = ""
+    # 이 파일을 파싱할 때 헤더 배치 캐시(deunggi.layout.HEADER_PLANS) 적중/실패 수
+    header_plan_hits: int = 0
+    header_plan_misses: int = 0
+    # 레이아웃 지문과 그 레이아웃 헤더에서 찾지 못한 열 (deunggi.layout.ExtractionPlan)
+    layout: str = ""
+    layout_missing: list = None
+
+    @property
+    def file_name(self):
+        return os.path.basename(self.path)
+
+
+@dataclass
+class ConsolidatedResult:
+    """
+    여러 엑셀 파일의 파싱 결과와 처리 통계
+    header_plan_stats: 이번에 새로 파싱한 파일들의 헤더 배치 캐시 적중/실패 합계
+    layouts: {레이아웃 지문: {"files": 파일 수, "sample": 첫 파일명, "missing": 찾지 못한 열}}
+    base: 증분 병합할 때 기존 통합 결과에서 남긴 행 {"szj"/"syg"/"djg": DataFrame} (deunggi.merge.merge_existing)
+    """
+    registries: list = field(default_factory=list)
+    summary: RunSummary = field(default_factory=RunSummary)
+    header_plan_stats: dict = field(default_factory=lambda: {"hits": 0, "misses": 0})
+    layouts: dict = field(default_factory=dict)
+    base: dict = None
+
+    def section_list(self, section):
+        """시트에 들어갈 DataFrame 목록: 기존 결과에서 남긴 행(있으면) + 파일별 결과"""
+        frames = [getattr(r, section) for r in self.registries if getattr(r, section) is not None]
+        base = (self.base or {}).get(section)
+        if base is not None and not base.empty:
+            frames.insert(0, base)
+        return frames
+
+    @property
+    def szj_list(self):
+        return self.section_list("szj")
+
+    @property
+    def syg_list(self):
+        return self.section_list("syg")
+
+    @property
+    def djg_list(self):
+        return self.section_list("djg")
+
+    def write_workbook(self, path, writer=DEFAULT_WRITER, max_rows=DEFAULT_MAX_ROWS):
+        """
+        writer: 결과 워크북 작성 방식 이름 (deunggi.writer.WRITERS)
+        max_rows: 시트 1개의 행 예산, 넘으면 이어지는 시트로 나눔
+        시트를 나눴으면 분할 정보(shard_manifest), 아니면 None을 반환
+        """
+        parts = write_workbook(self.szj_list, self.syg_list, self.djg_list, path, writer=writer, max_rows=max_rows)
+        return shard_manifest(parts, max_rows)
+
+    def export_tables(self, out_dir, formats):
+        """시트별 합친 표를 formats 형식(deunggi.export.EXPORTERS)으로 out_dir에 저장, 파일 경로 목록 반환"""
+        return export_tables(self.szj_list, self.syg_list, self.djg_list, out_dir, formats)
+
+
+def output_options(writer=DEFAULT_WRITER, max_rows=DEFAULT_MAX_ROWS, exports=(), merge_key=None,
+                   reader=DEFAULT_READER):
+    """
+    통합 결과 ZIP 내용을 바꾸는 옵션 중 기본값이 아닌 것 (결과 캐시 키용), 없으면 None
+    merge_key: 증분 병합할 기존 통합 결과의 내용 키 (deunggi.merge.merge_source_key)
+    reader: 시트 리더 이름 - 리더마다 읽기 오류 종류 등이 다를 수 있으므로 구분
+    """
+    options = {}
+    if reader != DEFAULT_READER:
+        options["reader"] = reader
+    # 다른 작성 방식은 같은 워크북을 만들므로 서식 없는 방식만 구분
+    if writer == DATA_ONLY_WRITER:
+        options["writer"] = writer
+    if max_rows != DEFAULT_MAX_ROWS:
+        options["max_rows"] = max_rows
+    if exports:
+        options["exports"] = sorted(set(exports))
+    if merge_key:
+        options["merge"] = merge_key
+    return options or None
+
+
+def find_excel_files(folder):
+    """폴더 아래의 .xlsx 파일 경로 목록"""
+    excel_files = []
+    for root, _, files in os.walk(folder):
+        for f in files:
+            if f.lower().endswith(".xlsx"):
+                excel_files.append(os.path.join(root, f))
+    return excel_files
+
+
+def extract_excel_zip(zip_file, extract_to):
+    """엑셀 ZIP을 압축 해제하고 .xlsx 파일 경로 목록을 반환"""
+    with zipfile.ZipFile(zip_file, "r") as z:
+        z.extractall(extract_to)
+    return find_excel_files(extract_to)
+
+
+def compile_extraction_plan(fingerprint, column_count, headers):
+    """처음 보는 레이아웃: 기존 휴리스틱으로 섹션별 헤더를 해석해 추출 계획 작성"""
+    plan = ExtractionPlan(fingerprint, column_count)
+    for name, header_row in headers.items():
+        if header_row is None:
+            continue
+        if name == "소유지분현황":
+            columns = SZJ_COLUMNS
+            plan.sections[name] = named_cols_plan(header_row, columns)
+            col_map = plan.sections[name][0]
+        else:
+            columns = RIGHTS_COLUMNS
+            col_map = plan.sections[name] = precise_cols_plan(header_row, columns)
+        plan.missing.extend(f"{name}:{column}" for column in columns if column not in col_map)
+    return plan
+
+
+def extraction_plan(column_count, sections):
+    """
+    열 수와 섹션 헤더 행으로 레이아웃 지문을 만들고 추출 계획을 찾음
+    sections: extract_sections 결과 {섹션 이름: (섹션, 발견 여부)}
+    """
+    headers = {name: section.iloc[0] if found else None for name, (section, found) in sections.items()}
+    fingerprint = layout_fingerprint(column_count, headers)
+    return HEADER_PLANS.get_or_resolve(
+        ("layout", fingerprint), lambda: compile_extraction_plan(fingerprint, column_count, headers)
+    )
+
+
+def set_column(df, column, values):
+    """열 dtype을 유지하며 값 목록으로 교체"""
+    df[column] = pd.Series(values, index=df.index, dtype=df[column].dtype)
+
+
+def normalize_owner_rows(szj_df):
+    """
+    소유지분현황 행 정리 (szj_df를 직접 수정, 열 단위 처리)
+    1. 등기명의인에서 소유구분·주민등록번호 분리, 주소↔최종지분 자리 교정
+    2. 주소에 남은 단독(소유)을 최종지분으로 이동
+    3. 최종지분을 지분 표기만 남기고, 주소로 보이면 주소 열로 이동
+    각 단계는 앞 단계가 끝난 값을 기준으로 함
+    """
+    owner = szj_df["등기명의인"].to_numpy(dtype=object)
+    address = szj_df["주소"].to_numpy(dtype=object)
+    jibun = szj_df["최종지분"].to_numpy(dtype=object)
+    owner_ok = pd.notna(owner)
+    owner_text = pd.Series([str(v) for v in owner], dtype=object)
+
+    # 1-1. (소유자)/(공유자) → 소유구분, 등기명의인 띄어쓰기 제거
+    ownership = owner_text.str.extract(r'\((소유자|공유자)\)', expand=False)
+    has_ownership = owner_ok & ownership.notna().to_numpy()
+    new_owner = owner.copy()
+    for i in np.flatnonzero(owner_ok):
+        if has_ownership[i]:
+            new_owner[i] = owner_text[i].replace(f"({ownership[i]})", "").strip().replace(" ", "")
+        else:
+            new_owner[i] = owner_text[i].replace(" ", "")
+    ownership_type = np.where(has_ownership, ownership.fillna("").to_numpy(dtype=object), "")
+
+    # 1-2. 주민등록번호 분리 (원래 등기명의인 기준)
+    jumin = owner_text.str.extract(r'(\d{6}-[\d\*]+)', expand=False)
+    has_jumin = owner_ok & jumin.notna().to_numpy()
+    new_jumin = szj_df["(주민)등록번호"].to_numpy(dtype=object).copy()
+    for i in np.flatnonzero(has_jumin):
+        new_jumin[i] = jumin[i]
+        new_owner[i] = owner_text[i].replace(jumin[i], "").strip().replace(" ", "")
+
+    # 1-3. 주소에 지분이 있으면 최종지분으로, 최종지분이 주소로 보이면 주소로
+    address_text = [str(v).strip() for v in address]
+    jibun_text = [str(v).strip() for v in jibun]
+    new_address = address.copy()
+    new_jibun = jibun.copy()
+    for i in np.flatnonzero(pd.notna(address)):
+        if not is_jibun_pattern(address_text[i]):
+            continue
+        jibun_in_address = extract_jibun(address_text[i])
+        if jibun_in_address:
+            # 최종지분이 비어있거나, 주소에서 발견한 지분이 더 정확해 보이는 경우
+            if not jibun_text[i] or len(jibun_in_address) > len(jibun_text[i]):
+                new_jibun[i] = jibun_in_address
+            # 주소에서는 지분 정보 제거
+            new_address[i] = address_text[i].replace(jibun_in_address, "").strip()
+    for i in np.flatnonzero(pd.notna(jibun)):
+        # 주소 필드가 비어있거나 최종지분의 텍스트가 더 길면(상세 주소일 가능성)
+        if is_address_pattern(jibun_text[i]) and (not address_text[i] or len(jibun_text[i]) > len(address_text[i])):
+            new_address[i] = jibun_text[i]
+            new_jibun[i] = ""
+
+    # 2. 단독 텍스트가 주소에 있고 최종지분에 없으면 이동
+    address_text = pd.Series([str(v).strip() for v in new_address], dtype=object)
+    sole = address_text.str.contains("단독", regex=False).to_numpy() & \
+        np.array(["단독소유" not in str(v) for v in new_jibun], dtype=bool)
+    new_jibun[sole] = "단독소유"
+    new_address[sole] = address_text[sole].str.replace(r'단독(?:소유)?', '', regex=True).str.strip().to_numpy()
+
+    # 3. 최종지분에서 지분 패턴만 남기고, 지분이 없고 주소로 보이면 주소 열로 이동
+    for i in np.flatnonzero(pd.notna(new_jibun)):
+        jibun_value = str(new_jibun[i]).strip()
+        if not jibun_value:
+            continue
+        # 단독소유 확인 포함 (extract_jibun)
+        extracted_jibun = extract_jibun(jibun_value)
+        if extracted_jibun:
+            new_jibun[i] = extracted_jibun
+        elif is_address_pattern(jibun_value):
+            if str(new_address[i]).strip() == "":
+                new_address[i] = jibun_value
+            new_jibun[i] = ""
+
+    szj_df["소유구분"] = list(ownership_type)
+    set_column(szj_df, "등기명의인", new_owner)
+    set_column(szj_df, "(주민)등록번호", new_jumin)
+    set_column(szj_df, "주소", new_address)
+    set_column(szj_df, "최종지분", new_jibun)
+
+
+def share_decimal(jibun):
+    """최종지분 값 → 소수 지분 (문자열은 메모 캐시 사용, 변환 중 오류는 None)"""
+    try:
+        if isinstance(jibun, str):
+            return cached_jibun_decimal(jibun)
+        return convert_jibun_to_decimal(jibun)
+    except Exception:
+        return None
+
+
+def share_area_columns(szj_df, land_area):
+    """
+    (지분면적, 최종지분 수치화) 열 값: 최종지분을 소수로 바꿔 토지면적을 곱함
+    같은 최종지분 문자열("단독소유", "2분의 1" 등)은 한 번만 변환해 행에 나눠 줌
+    변환할 수 없으면 None
+    """
+    land_area_value = None
+    if pd.notna(land_area) and land_area:
+        try:
+            land_area_value = float(str(land_area).replace(',', ''))
+        except ValueError:
+            pass
+    codes, uniques = pd.factorize(szj_df["최종지분"])
+    unique_decimals = [share_decimal(jibun) for jibun in uniques]
+    # 빈 값(NaN)은 코드 -1 → 마지막 None
+    decimals = np.array(unique_decimals + [None], dtype=object)[codes]
+    decimal_values = np.array([np.nan if d is None else d for d in unique_decimals] + [np.nan], dtype=float)[codes]
+
+    areas = np.full(len(codes), None, dtype=object)
+    has_area = ~np.isnan(decimal_values)
+    if land_area_value is not None and has_area.any():
+        areas[has_area] = [f"{area:.4f}" for area in land_area_value * decimal_values[has_area]]
+    return pd.Series(areas, index=szj_df.index, dtype=object), pd.Series(decimals, index=szj_df.index, dtype=object)
+
+
+def process_workbook(path, reader=DEFAULT_READER):
+    """
+    등기부등본 엑셀 파일 1개를 파싱하는 함수
+    reader: 시트 리더 이름 (deunggi.reader.READERS)
+    예외는 밖으로 던지지 않고 ParsedRegistry.error_type/error_message에 기록
+    """
+    registry = ParsedRegistry(path=path)
+    plan_hits, plan_misses = HEADER_PLANS.hits, HEADER_PLANS.misses
+    try:
+        df = read_registry_sheet(path, reader=reader)
+        # 행 문자열과 요약 구간 해석(parse_summary)은 한 번만 만들어 식별자·면적·지목 추출이 함께 사용
+        # 요약에서 찾지 못한 값만 시트 전체에서 다시 찾음
+        doc = RegistryDocument(df)
+        name = registry.name = extract_identifier(doc)
+        land_area = registry.land_area = extract_land_area(doc)
+        land_type = registry.land_type = extract_land_type(doc)
+        # 세 섹션의 시작/끝 행을 한 번의 행 순회로 찾음
+        sections = extract_sections(df, REGISTRY_SECTIONS)
+        szj_sec, has_szj = sections["소유지분현황"]
+        syg_sec, has_syg = sections["소유권사항"]
+        djg_sec, has_djg = sections["저당권사항"]
+
+        # 발견된 섹션 기록 (성공/실패 통계용)
+        registry.sections_found = []
+        if has_szj: registry.sections_found.append("소유지분현황")
+        if has_syg: registry.sections_found.append("소유권사항")
+        if has_djg: registry.sections_found.append("저당권사항")
+
+        # 레이아웃 지문으로 추출 계획(섹션별 열 매핑) 조회
+        plan = extraction_plan(df.shape[1], sections)
+        registry.layout = plan.fingerprint
+        registry.layout_missing = plan.missing
+
+        if has_szj:
+            szj_df = extract_named_cols(szj_sec, SZJ_COLUMNS, plan=plan.sections["소유지분현황"])
+            szj_df["소유구분"] = ""
+            if len(szj_df):
+                normalize_owner_rows(szj_df)
+            # 토지면적 열 추가
+            szj_df["지목"] = land_type      # 지목 열 추가
+            szj_df["토지면적"] = land_area
+            # 소유면적 계산 및 열 추가
+            szj_df["지분면적"] = None
+            # 최종지분 수치화 열 추가
+            szj_df["최종지분 수치화"] = None
+            if len(szj_df):
+                szj_df["지분면적"], szj_df["최종지분 수치화"] = share_area_columns(szj_df, land_area)
+            # 열 순서 재배치
+            szj_df.insert(0, "토지주소", name)
+            columns = ["토지주소", "등기명의인", "소유구분", "(주민)등록번호", "주소", "순위번호", "최종지분", "최종지분 수치화", "지목", "토지면적", "지분면적"]
+            szj_df = szj_df[columns]
+            szj_df["그룹정보"] = "있음"  # 그룹 헤더를 사용할 데이터 플래그
+            registry.szj = szj_df
+        else:
+            # "기록없음" 케이스에도 동일한 컬럼 구조 유지
+            registry.szj = pd.DataFrame([[name, "기록없음", "", "", "", "", "", "", land_type, land_area, "", "없음"]],
+                                        columns=["토지주소", "등기명의인", "소유구분", "(주민)등록번호", "주소", "순위번호", "최종지분", "최종지분 수치화", "지목", "토지면적", "지분면적", "그룹정보"])
+        if has_syg:
+            syg_df = extract_precise_named_cols(syg_sec, RIGHTS_COLUMNS, plan=plan.sections["소유권사항"])
+            syg_df.insert(0, "토지주소", name)
+            registry.syg = syg_df
+        else:
+            registry.syg = pd.DataFrame([[name, "기록없음"]], columns=["토지주소", "순위번호"])
+        if has_djg:
+            djg_df = extract_precise_named_cols(djg_sec, RIGHTS_COLUMNS, plan=plan.sections["저당권사항"])
+
+            # 빈 행 제거 - 빈 문자열을 NA로 변환 후 모든 값이 NA인 행 제거
+            djg_df = djg_df.replace('', pd.NA)
+            djg_df = djg_df.dropna(how='all')
+
+            # 공백만 있는 행도 제거 (문자열을 trim한 후 빈 문자열인지 확인)
+            mask = ~djg_df.astype(str).apply(lambda row: row.str.strip().eq('').all(), axis=1)
+            djg_df = djg_df[mask].reset_index(drop=True)
+
+            # 빈 값을 다시 빈 문자열로 변환
+            djg_df = djg_df.fillna('')
+
+            # "대상소유자" 컬럼에서 모든 띄어쓰기 제거
+            if "대상소유자" in djg_df.columns:
+                djg_df["대상소유자"] = djg_df["대상소유자"].astype(str).str.replace(" ", "")
+
+            djg_df = merge_same_row_if_amount_separated(djg_df)
+            djg_df = trim_after_reference_note(djg_df)
+            djg_df = extract_right_holders(djg_df)
+            djg_df.insert(0, "토지주소", name)
+
+            registry.djg = djg_df
+        else:
+            # 빈 데이터프레임에도 모든 열 포함 - 기록유무 열 제거
+            registry.djg = pd.DataFrame([[name, "기록없음", "", "", "", "", "", ""]],
+                                        columns=["토지주소", "순위번호", "등기목적", "접수정보", "주요등기사항", "대상소유자", "근저당권자", "지상권자"])
+    except Exception as e:
+        registry.error_type = type(e).__name__
+        registry.error_message = str(e)
+    registry.header_plan_hits = HEADER_PLANS.hits - plan_hits
+    registry.header_plan_misses = HEADER_PLANS.misses - plan_misses
+    return registry
+
+
+def summarize_registry(summary, registry):
+    """파일 1개의 처리 결과를 성공/실패 통계에 반영"""
+    file_name = registry.file_name
+    if registry.sections_found is not None:
+        if registry.sections_found:
+            summary.add_success(f"{file_name} → {registry.name} (섹션: {', '.join(registry.sections_found)})")
+        else:
+            error_type = "필요 섹션 미발견"
+            summary.add_failure(error_type, f"{file_name} → {registry.name} ({error_type})")
+    if registry.error_type:
+        summary.add_failure(f"파일 처리 오류: {registry.error_type}", f"{file_name} - {registry.error_message[:50]}...")
+
+
+def iter_registries(paths, workers=1, reader=DEFAULT_READER):
+    """
+    ParsedRegistry를 입력 순서대로 생성
+    workers > 1이면 파일별 파싱을 프로세스 풀에 나눠 맡기고, 완료 순서와 관계없이
+    입력 순서대로 돌려주므로 직렬 처리와 같은 결과 시트가 만들어짐
+    """
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield process_workbook(path, reader=reader)
+        return
+
+    # 파일당 작업이 짧으므로 몇 개씩 묶어서 전달 (프로세스 간 통신 횟수 감소)
+    chunksize = max(1, min(16, len(paths) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(partial(process_workbook, reader=reader), paths, chunksize=chunksize)
+
+
+def process_batch(paths, progress=None, workers=1, parse_cache=None, reader=DEFAULT_READER):
+    """
+    여러 엑셀 파일을 처리하는 함수 (결과는 항상 입력 순서)
+    progress(done, total) 콜백으로 진행률을 알림
+    workers: 병렬 파싱 프로세스 수 (1이면 직렬 처리)
+    reader: 시트 리더 이름 (deunggi.reader.READERS)
+    parse_cache: ParseCache를 넘기면 내용·리더가 같은 파일은 파싱을 건너뛰고 캐시 결과 사용 (오류 결과는 저장하지 않음)
+    """
+    result = ConsolidatedResult()
+    result.summary.total = len(paths)
+    registries = [None] * len(paths)
+    done = 0
+
+    # 1. 캐시에 있는 파일은 바로 채움
+    keys = {}
+    if parse_cache is not None:
+        for i, path in enumerate(paths):
+            keys[i] = file_cache_key(path, reader)
+            registries[i] = parse_cache.get(keys[i], path)
+            if registries[i] is not None:
+                done += 1
+                if progress is not None:
+                    progress(done, len(paths))
+
+    # 2. 나머지 파일만 파싱
+    pending = [i for i, registry in enumerate(registries) if registry is None]
+    for i, registry in zip(pending, iter_registries([paths[i] for i in pending], workers=workers, reader=reader)):
+        registries[i] = registry
+        result.header_plan_stats["hits"] += registry.header_plan_hits
+        result.header_plan_stats["misses"] += registry.header_plan_misses
+        if parse_cache is not None:
+            parse_cache.put(keys[i], registry)
+        done += 1
+        if progress is not None:
+            progress(done, len(paths))
+    if parse_cache is not None:
+        parse_cache.evict()
+
+    for registry in registries:
+        result.registries.append(registry)
+        summarize_registry(result.summary, registry)
+        if registry.layout:
+            layout = result.layouts.setdefault(registry.layout, {
+                "files": 0, "sample": registry.file_name, "missing": registry.layout_missing or [],
+            })
+            layout["files"] += 1
+    return result
+
+
+def write_result_zip(excel_result_path, pdf_result_path, output_zip, manifest=None, export_paths=()):
+    """엑셀 결과와 (있으면) PDF 결과·시트 분할 정보·표 데이터 파일을 통합 결과 ZIP으로 묶음"""
+    with zipfile.ZipFile(output_zip, 'w') as z:
+        z.write(excel_result_path, arcname=EXCEL_RESULT_NAME)
+        if manifest:
+            z.writestr(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2))
+        for path in export_paths:
+            z.write(path, arcname=f"{EXPORT_DIR_NAME}/{os.path.basename(path)}")
+        if pdf_result_path and os.path.exists(pdf_result_path):
+            z.write(pdf_result_path, arcname=PDF_RESULT_NAME)
@@ -0,0 +1,97 @@
+"""
+통합 결과 표 내보내기 (Parquet / CSV / Feather)
+
+시트 3개(소유지분현황/소유권사항/저당권사항)로 합친 DataFrame을 서식 없이 파일로 저장합니다.
+엑셀 결과와 같은 정렬·열 구성이며, 행 수 제한이 없으므로 시트처럼 나누지 않습니다.
+Parquet·Feather는 pyarrow가 필요합니다 (requirements.txt에는 없으므로 쓸 때 `pip install pyarrow`).
+"""
+import importlib.util
+import os
+
+import pandas as pd
+
+from .writer import DJG_SHEET, SYG_SHEET, SZJ_SHEET, sheet_tables
+
+# 시트별 내보낼 파일 이름 (확장자 제외)
+EXPORT_NAMES = {
+    SZJ_SHEET: "소유지분현황",
+    SYG_SHEET: "소유권사항",
+    DJG_SHEET: "저당권사항",
+}
+
+
+def columnar_frame(df):
+    """
+    Parquet/Feather용: 값 종류가 섞인 object 열을 한 종류로 맞춤
+    빈 문자열을 뺀 값이 모두 숫자면 숫자 열(빈 문자열은 결측), 아니면 문자열 열
+    """
+    mixed = [
+        col for col in df.columns
+        if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed")
+    ]
+    if not mixed:
+        return df
+    df = df.copy()
+    for col in mixed:
+        values = df[col].mask(df[col].map(lambda v: isinstance(v, str) and not v.strip()))
+        if pd.api.types.infer_dtype(values, skipna=True) in ("floating", "integer", "mixed-integer-float"):
+            df[col] = pd.to_numeric(values)
+        else:
+            df[col] = df[col].astype("string")
+    return df
+
+
+def write_parquet(df, path):
+    columnar_frame(df).to_parquet(path, index=False)
+
+
+def write_csv(df, path):
+    # 엑셀에서 바로 열어도 한글이 깨지지 않도록 BOM 포함
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+
+
+def write_feather(df, path):
+    columnar_frame(df).to_feather(path)
+
+
+# 형식 이름: (확장자, 저장 함수, 필요한 선택 패키지 또는 None)
+EXPORTERS = {
+    "parquet": (".parquet", write_parquet, "pyarrow"),
+    "csv": (".csv", write_csv, None),
+    "feather": (".feather", write_feather, "pyarrow"),
+}
+
+
+def format_available(name):
+    requires = EXPORTERS[name][2]
+    return requires is None or importlib.util.find_spec(requires) is not None
+
+
+def check_formats(formats):
+    """알 수 없는 형식이거나 필요한 패키지가 없어 쓸 수 없는 형식이면 ValueError"""
+    for name in formats:
+        if name not in EXPORTERS:
+            raise ValueError(f"알 수 없는 내보내기 형식: {name} (사용 가능: {', '.join(EXPORTERS)})")
+        if not format_available(name):
+            raise ValueError(f"{name} 내보내기에는 {EXPORTERS[name][2]} 패키지가 필요합니다 (pip install {EXPORTERS[name][2]})")
+
+
+def export_tables(szj_list, syg_list, djg_list, out_dir, formats):
+    """
+    결과가 있는 시트의 DataFrame을 formats 형식(EXPORTERS 키)별로 out_dir에 저장
+    저장한 파일 경로 목록을 반환
+    """
+    check_formats(formats)
+    if not formats:
+        return []
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for sheetname, df, _ in sheet_tables(szj_list, syg_list, djg_list):
+        if df is None:
+            continue
+        for name in dict.fromkeys(formats):
+            suffix, write, _ = EXPORTERS[name]
+            path = os.path.join(out_dir, EXPORT_NAMES[sheetname] + suffix)
+            write(df, path)
+            paths.append(path)
+    return paths
@@ -0,0 +1,952 @@
+"""
+등기부등본(열람용) 엑셀 시트에서 섹션·열·지분·지목·면적을 추출하는 함수 모음
+Streamlit 없이도 import 할 수 있도록 화면 코드와 분리되어 있습니다.
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from .document import RegistryDocument
+from .landtype import LAND_TAG, LAND_TYPE_MATCHER
+from .layout import HEADER_PLANS
+from .share import SHARE_PARSER
+
+# 3. (근)저당권 및 전세권 등(을구) 섹션 시작/끝 키워드 (공백 무시 정확 일치)
+DJG_SECTION_START = "3.(근)저당권및전세권등(을구)"
+DJG_SECTION_END = ["참고", "비고", "총계", "전산자료"]
+
+
+def merge_adjacent_cells(row_series, max_gap=3):
+    """
+    인접한 셀들을 병합하여 하나의 의미있는 단위로 만드는 함수
+    데이터 행에서는 더 신중하게 병합
+    """
+    merged_row = row_series.copy()
+    row_dict = row_series.to_dict()
+    
+    # 빈 셀이 아닌 셀들의 인덱스를 찾기
+    non_empty_indices = [idx for idx, val in row_dict.items() if str(val).strip()]
+    
+    # 데이터가 너무 적거나 많으면 병합하지 않음 (헤더가 아닌 경우)
+    if len(non_empty_indices) < 2 or len(non_empty_indices) > 10:
+        return merged_row
+    
+    # 연속된 셀들을 그룹화 (더 엄격한 조건)
+    groups = []
+    current_group = []
+    
+    for i, idx in enumerate(non_empty_indices):
+        if not current_group:
+            current_group = [idx]
+        else:
+            # 이전 인덱스와의 거리가 2 이하면 같은 그룹 (더 엄격하게)
+            if idx - current_group[-1] <= 2:
+                current_group.append(idx)
+            else:
+                # 새로운 그룹 시작
+                groups.append(current_group)
+                current_group = [idx]
+    
+    if current_group:
+        groups.append(current_group)
+    
+    # 각 그룹 내의 셀들을 병합 (더 신중하게)
+    for group in groups:
+        if len(group) > 1 and len(group) <= 3:  # 너무 많은 셀은 병합하지 않음
+            # 그룹 내 모든 값을 연결
+            merged_value = ""
+            for idx in group:
+                val = str(row_dict.get(idx, "")).strip()
+                if val:
+                    if merged_value and not merged_value.endswith((" ", "-", "/")):
+                        merged_value += " "
+                    merged_value += val
+            
+            # 첫 번째 인덱스에 병합된 값 저장
+            merged_row[group[0]] = merged_value
+            
+            # 나머지 인덱스는 빈 값으로 설정
+            for idx in group[1:]:
+                merged_row[idx] = ""
+    
+    return merged_row
+
+# 배열의 각 셀에 str(val).strip() 적용 (object 배열 반환)
+_strip_cells = np.frompyfunc(lambda val: str(val).strip(), 1, 1)
+
+def merge_dataframe_cells(df, is_header_row=False):
+    """
+    데이터프레임에 셀 병합 로직 적용
+    헤더 행과 데이터 행을 구분하여 처리
+    (merge_adjacent_cells를 모든 행에 적용한 것과 같은 결과를 배열 연산으로 한 번에 계산)
+    """
+    if df.empty:
+        return df
+    
+    merged_df = df.copy()
+    # merge_adjacent_cells는 열 이름을 위치처럼 빼서 거리를 재므로 열 이름이 0..n-1일 때만 배열로 계산
+    if not merged_df.columns.equals(pd.RangeIndex(merged_df.shape[1])):
+        return merge_dataframe_cells_by_row(merged_df)
+    
+    # 빈 셀이 아닌 셀 (str(val).strip() 기준)
+    stripped = _strip_cells(merged_df.to_numpy(dtype=object))
+    non_empty = stripped != ""
+    
+    # 비어 있지 않은 셀이 2~10개인 행만 병합 대상
+    counts = non_empty.sum(axis=1)
+    rows, cols = np.nonzero(non_empty & ((counts >= 2) & (counts <= 10))[:, None])
+    if len(rows) == 0:
+        return merged_df
+    
+    # 같은 행에서 이전 셀과의 거리가 2 이하면 같은 그룹, 2~3개짜리 그룹만 병합
+    new_group = np.ones(len(rows), dtype=bool)
+    new_group[1:] = (rows[1:] != rows[:-1]) | (cols[1:] - cols[:-1] > 2)
+    group_ids = np.cumsum(new_group) - 1
+    group_sizes = np.bincount(group_ids)
+    in_merged_group = (group_sizes[group_ids] >= 2) & (group_sizes[group_ids] <= 3)
+    if not in_merged_group.any():
+        return merged_df
+    
+    updates = {}  # {열 위치: ([행 위치], [값])}
+    starts = np.flatnonzero(new_group & in_merged_group)
+    for start in starts:
+        end = start + group_sizes[group_ids[start]]
+        merged_value = ""
+        for k in range(start, end):
+            val = stripped[rows[k], cols[k]]
+            if merged_value and not merged_value.endswith((" ", "-", "/")):
+                merged_value += " "
+            merged_value += val
+        # 첫 번째 셀에 병합된 값, 나머지는 빈 값
+        for k in range(start, end):
+            row_idx, col_idx = updates.setdefault(cols[k], ([], []))
+            row_idx.append(rows[k])
+            col_idx.append(merged_value if k == start else "")
+    
+    # 문자열을 넣을 수 없는 열(숫자 dtype)이면 기존 행 단위 처리로 (같은 오류/변환 유지)
+    if not all(pd.api.types.is_string_dtype(merged_df.dtypes.iloc[c]) for c in updates):
+        return merge_dataframe_cells_by_row(merged_df)
+    for c, (row_idx, values) in updates.items():
+        merged_df.iloc[row_idx, c] = values
+    
+    return merged_df
+
+def merge_dataframe_cells_by_row(merged_df):
+    """merge_adjacent_cells를 행마다 적용 (merged_df를 직접 수정)"""
+    # 첫 번째 행은 헤더로 가정하고 더 관대하게 병합
+    if len(merged_df) > 0:
+        merged_df.iloc[0] = merge_adjacent_cells(merged_df.iloc[0], max_gap=3)
+    
+    # 나머지 행들은 데이터 행으로 더 엄격하게 병합
+    for i in range(1, len(merged_df)):
+        merged_df.iloc[i] = merge_adjacent_cells(merged_df.iloc[i], max_gap=2)
+    
+    return merged_df
+
+def trim_after_reference_note(df):
+    for i, row in df.iterrows():
+        row_text = "".join(str(cell) for cell in row)
+        normalized = re.sub(r"\s+", "", row_text)
+        if "참고사항" in normalized or "참고" in normalized or "비고" in normalized:
+            return df.iloc[:i]
+    return df
+
+IDENTIFIER_TAGS = ("[토지]", "[건물]")
+# 면적 표기: 숫자 + ㎡ 또는 m²
+AREA_RE = re.compile(r'(\d[\d,\.]*)\s*[㎡m²]')
+
+def extract_identifier(df):
+    """
+    파일에서 토지/건물 식별자를 추출하는 함수
+    df: 시트 DataFrame 또는 RegistryDocument
+    """
+    doc = RegistryDocument.of(df)
+    if doc.identifier is None:
+        doc.identifier = parse_summary(doc).identifier or find_identifier(doc)
+    return doc.identifier
+
+def identifier_text(row_text):
+    """[토지]/[건물]로 시작하는 행이면 연속된 공백을 하나로 통일한 문자열, 아니면 None"""
+    content = row_text.strip()
+    if content.startswith(IDENTIFIER_TAGS):
+        return re.sub(r'\s+', ' ', content)
+    return None
+
+def find_identifier(doc):
+    """고유번호 다음 10행 이내, 없으면 전체에서 [토지]/[건물]로 시작하는 행"""
+    row_texts = doc.row_texts
+    i = doc.identifier_row_idx
+    if i is not None:
+        for j in range(i+1, min(i+10, len(doc))):
+            content = identifier_text(row_texts[j])
+            if content is not None:
+                return content
+    
+    # 고유번호 이후에 [토지] 또는 [건물]이 없는 경우, 전체 데이터에서 찾기
+    for row_text in row_texts:
+        content = identifier_text(row_text)
+        if content is not None:
+            return content
+            
+    return "알수없음"
+
+@dataclass
+class RegistrySummary:
+    """
+    주요 등기사항 요약에서 읽은 값 (요약에서 찾지 못한 값은 None)
+    found: 요약 행이 있는지 여부
+    """
+    found: bool = False
+    identifier: str = None
+    land_type: str = None
+    land_area: str = None
+
+def parse_summary(df):
+    """
+    주요 등기사항 요약 다음 9행을 한 번 훑어 식별자·지목·토지면적을 함께 읽는 함수
+    결과는 RegistryDocument에 저장되어 extract_identifier/extract_land_type/extract_land_area가 함께 사용
+    df: 시트 DataFrame 또는 RegistryDocument
+    """
+    doc = RegistryDocument.of(df)
+    if doc.summary is None:
+        doc.summary = read_summary(doc)
+    return doc.summary
+
+def read_summary(doc):
+    summary = RegistrySummary()
+    start = doc.summary_row_idx
+    if start is None:
+        return summary
+    summary.found = True
+    row_texts = doc.row_texts
+    # 고유번호 행이 요약 행 이후에 있으면 식별자(고유번호 다음 10행 이내)도 요약 구간에서 정해짐
+    id_idx = doc.identifier_row_idx
+    id_end = min(id_idx + 10, start + 10) if id_idx is not None and id_idx >= start else start
+    
+    for i in range(start + 1, min(start + 10, len(doc))):
+        row_text = row_texts[i]
+        if summary.identifier is None and id_idx is not None and id_idx < i < id_end:
+            summary.identifier = identifier_text(row_text)
+        if LAND_TAG not in row_text:
+            continue
+        # [토지] 바로 다음 지목이거나 50자 이내에 있는 지목
+        if summary.land_type is None:
+            summary.land_type = LAND_TYPE_MATCHER.near_tag(
+                row_text, LAND_TYPE_MATCHER.occurrences(row_text), 50, after_tag=True) or None
+        if summary.land_area is None:
+            area_match = AREA_RE.search(row_text)
+            if area_match:
+                summary.land_area = area_match.group(1).replace(',', '')
+    return summary
+
+def convert_jibun_to_decimal(jibun_text):
+    """
+    최종지분 텍스트를 소수점 형태로 변환하는 함수
+    예: "2분의 1" -> 0.5, "1/2" -> 0.5, "50%" -> 0.5, "단독소유" -> 1
+    """
+    if not jibun_text or pd.isna(jibun_text):
+        return None
+    
+    jibun_text = str(jibun_text).strip()
+    share = SHARE_PARSER.parse(jibun_text)
+    
+    # 퍼센트 표기("[\d.]+%"로 읽음)나 분모가 0인 경우는 다음 표기로 넘어가는 기존 규칙 그대로
+    if "%" in jibun_text or (share is not None and share.decimal is None):
+        return convert_jibun_to_decimal_by_rules(jibun_text)
+    return share.decimal if share is not None else None
+
+# 파일·배치 사이에 반복되는 최종지분 문자열("단독소유", "2분의 1" 등) 변환 결과 메모
+SHARE_DECIMAL_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=SHARE_DECIMAL_CACHE_SIZE)
+def cached_jibun_decimal(jibun_text):
+    """convert_jibun_to_decimal 메모 버전 (문자열 전용, 최근 사용 순으로 개수 제한)"""
+    return convert_jibun_to_decimal(jibun_text)
+
+# 정규식 순차 검색용 (convert_jibun_to_decimal_by_rules)
+FRACTION_RE = re.compile(r'(?:공유)?(\d+)/(\d+)')
+PERCENT_RE = re.compile(r'([\d\.]+)\s*%')
+BOONUI_RE = re.compile(r'(\d+\.?\d*)\s*분\s*의\s*(\d+\.?\d*)')
+BOONUI_NOSPACE_RE = re.compile(r'(\d+\.?\d*)분의(\d+\.?\d*)')
+
+def convert_jibun_to_decimal_by_rules(jibun_text):
+    """표기 종류별로 차례로 검색하는 기존 변환 (jibun_text는 strip된 문자열)"""
+    # 단독소유는 1로 변환
+    if "단독소유" in jibun_text or (("단독" in jibun_text) and len(jibun_text) < 10):
+        return 1.0
+    
+    # 1) 분수 형태 (예: 1/2, 1/3, 공유1/3 등)
+    fraction_match = FRACTION_RE.search(jibun_text)
+    if fraction_match:
+        numerator = float(fraction_match.group(1))
+        denominator = float(fraction_match.group(2))
+        if denominator != 0:
+            return numerator / denominator
+    
+    # 2) 퍼센트 형태 (예: 50%, 33.3% 등)
+    percent_match = PERCENT_RE.search(jibun_text)
+    if percent_match:
+        return float(percent_match.group(1)) / 100
+    
+    # 3) '분의' 형태 (예: 3분의 1, 2분의 1 등)
+    boonui_match = BOONUI_RE.search(jibun_text)
+    if boonui_match:
+        denominator = float(boonui_match.group(1))
+        numerator = float(boonui_match.group(2))
+        if denominator != 0:
+            return numerator / denominator
+    
+    # 4) 분의 형태 - 띄어쓰기 없는 경우 (예: 10139.94분의845.0298)
+    boonui_match2 = BOONUI_NOSPACE_RE.search(jibun_text)
+    if boonui_match2:
+        denominator = float(boonui_match2.group(1))
+        numerator = float(boonui_match2.group(2))
+        if denominator != 0:
+            return numerator / denominator
+    
+    return None
+
+def keyword_match_partial(cell, keyword):
+    if pd.isnull(cell): return False
+    return keyword.replace(" ", "") in str(cell).replace(" ", "")
+
+def keyword_match_exact(cell, keyword):
+    if pd.isnull(cell): return False
+    return re.sub(r"\s+", "", str(cell)) == re.sub(r"\s+", "", keyword)
+
+def merge_split_headers(header_row):
+    """분리된 헤더를 병합하는 함수 - 개선된 버전"""
+    # 셀 병합을 하지 않고 원본 헤더를 그대로 사용
+    merged_row = header_row.copy()
+    
+    # 기존 특정 키워드 병합 로직만 적용 (인접 셀 병합은 제외)
+    split_patterns = {
+        "주소": ["주", "소"],
+        "등기명의인": ["등기", "명의인"],
+        "주민등록번호": ["주민", "등록번호"],
+        "최종지분": ["최종", "지분"],
+        "순위번호": ["순위", "번호"],
+        "등기목적": ["등기", "목적"],
+        "접수정보": ["접수", "정보"],
+        "주요등기사항": ["주요", "등기사항"],
+        "대상소유자": ["대상", "소유자"]
+    }
+    
+    for target_keyword, split_parts in split_patterns.items():
+        found_indices = []
+        for part in split_parts:
+            for idx, cell_value in merged_row.items():
+                cell_str = str(cell_value).strip()
+                if cell_str == part:
+                    found_indices.append(idx)
+                    break
+        
+        if len(found_indices) == len(split_parts):
+            if all(found_indices[i+1] - found_indices[i] <= 2 for i in range(len(found_indices)-1)):
+                merged_row[found_indices[0]] = target_keyword
+                for idx in found_indices[1:]:
+                    merged_row[idx] = ""
+    
+    return merged_row
+
+def enhanced_keyword_match(header_row, keyword, max_distance=2):
+    """인접한 셀들을 고려한 키워드 매칭 - 개선된 버전"""
+    # 먼저 정확한 매칭 시도
+    for idx, cell in header_row.items():
+        if keyword_match_exact(cell, keyword):
+            return idx
+    
+    # 부분 매칭 시도
+    for idx, cell in header_row.items():
+        if keyword_match_partial(cell, keyword):
+            return idx
+    
+    # 분리된 키워드 매칭 시도 (더 엄격하게)
+    keyword_chars = list(keyword.replace(" ", ""))
+    if len(keyword_chars) <= 1:
+        return None
+    
+    for start_idx, cell in header_row.items():
+        if str(cell).strip() == keyword_chars[0]:
+            # 첫 글자가 매칭되면 다음 글자들을 인접 셀에서 찾기
+            current_text = str(cell).strip()
+            current_idx = start_idx
+            
+            for i in range(1, len(keyword_chars)):
+                found_next = False
+                # 최대 max_distance까지 떨어진 셀에서 다음 글자 찾기
+                for offset in range(1, max_distance + 1):
+                    next_idx = current_idx + offset
+                    if next_idx in header_row:
+                        next_cell = str(header_row[next_idx]).strip()
+                        if next_cell == keyword_chars[i]:
+                            current_text += next_cell
+                            current_idx = next_idx
+                            found_next = True
+                            break
+                
+                if not found_next:
+                    break
+            
+            # 전체 키워드가 매칭되었는지 확인
+            if current_text == keyword.replace(" ", ""):
+                return start_idx
+    
+    return None
+
+def extract_section_range(df, start_kw, end_kw_list, match_fn):
+    return extract_sections(df, {"section": (start_kw, end_kw_list, match_fn)})["section"]
+
+def normalize_keyword(keyword, match_fn):
+    """match_fn 판정에 맞춰 키워드 공백 제거 (partial: 공백 문자만, exact: 모든 공백)"""
+    if match_fn is keyword_match_partial:
+        return keyword.replace(" ", "")
+    if match_fn is keyword_match_exact:
+        return "".join(keyword.split())
+    raise ValueError(f"지원하지 않는 match_fn: {match_fn}")
+
+def find_section_ranges(df, sections):
+    """
+    여러 섹션의 시작/끝 행을 한 번의 행 순회로 찾는 함수
+    sections: {이름: (시작 키워드, 끝 키워드 목록, match_fn)}
+    반환: {이름: (시작 행, 끝 행) 또는 None} - 섹션은 df.iloc[시작:끝]
+    extract_section_range와 같은 판정이지만 셀마다 match_fn을 부르지 않고
+    행별로 셀 문자열을 한 번만 정규화해 모든 섹션의 키워드를 함께 검사합니다.
+    - partial: 공백을 뺀 셀들을 "\0"으로 이은 문자열에서 부분 문자열 검색
+      (키워드에 "\0"이 없으므로 셀 경계를 넘는 일치는 생기지 않음)
+    - exact: 공백을 모두 뺀 셀 문자열 집합에서 검색
+    """
+    specs = {}
+    for name, (start_kw, end_kw_list, match_fn) in sections.items():
+        exact = match_fn is keyword_match_exact
+        specs[name] = (
+            normalize_keyword(start_kw, match_fn),
+            [normalize_keyword(kw, match_fn) for kw in end_kw_list],
+            exact,
+        )
+
+    ranges = dict.fromkeys(sections)
+    waiting = dict(specs)  # 시작 행을 찾는 중
+    started = {}           # 끝 행을 찾는 중 {이름: 시작 행}
+    for i, row in enumerate(df.to_numpy()):
+        if not waiting and not started:
+            break
+        cells = [str(cell) for cell in row if isinstance(cell, str) or not pd.isnull(cell)]
+        # 아직 찾는 섹션에 필요한 정규화만 수행
+        modes = {specs[name][2] for name in (*waiting, *started)}
+        texts = {}
+        if False in modes:
+            texts[False] = "\0".join(cell.replace(" ", "") for cell in cells)
+        if True in modes:
+            texts[True] = {"".join(cell.split()) for cell in cells}
+
+        for name, start in list(started.items()):
+            _, end_kws, exact = specs[name]
+            if any(kw in texts[exact] for kw in end_kws):
+                ranges[name] = (start, i)
+                del started[name]
+        for name, (start_kw, _, exact) in list(waiting.items()):
+            if start_kw in texts[exact]:
+                started[name] = i + 1
+                del waiting[name]
+
+    # 끝 표시가 없으면 시트 끝까지
+    for name, start in started.items():
+        ranges[name] = (start, len(df))
+    return ranges
+
+def extract_sections(df, sections):
+    """
+    find_section_ranges로 찾은 범위를 잘라 {이름: (섹션 DataFrame, 발견 여부)} 반환
+    섹션을 찾지 못하면 빈 DataFrame, 내용이 모두 비었으면 [["기록없음"]]
+    """
+    df = df.fillna("")
+    df.columns = range(df.shape[1])
+    sections_found = {}
+    for name, bounds in find_section_ranges(df, sections).items():
+        if bounds is None:
+            sections_found[name] = (pd.DataFrame(), False)
+            continue
+        section = df.iloc[bounds[0]:bounds[1]]
+        is_empty = not (section.to_numpy() != "").any()
+        sections_found[name] = (section if not is_empty else pd.DataFrame([["기록없음"]]), not is_empty)
+    return sections_found
+
+# process_workbook이 한 번에 찾는 섹션: {이름: (시작 키워드, 끝 키워드 목록, match_fn)}
+REGISTRY_SECTIONS = {
+    "소유지분현황": ("소유지분현황", ["소유권", "저당권"], keyword_match_partial),
+    "소유권사항": ("소유지분을제외한소유권에관한사항", ["저당권"], keyword_match_partial),
+    "저당권사항": (DJG_SECTION_START, DJG_SECTION_END, keyword_match_exact),
+}
+
+def resolve_named_cols(header_row, col_keywords):
+    """
+    extract_named_cols의 헤더 해석: (col_map, 최종지분 옆 빈 헤더 열)
+    col_map 값은 열 이름, 최종/지분이 나뉜 헤더면 (앞 열, 뒤 열)
+    """
+    merged_header = merge_split_headers(header_row)
+    
+    col_map = {}
+    for target in col_keywords:
+        col_idx = enhanced_keyword_match(merged_header, target)
+        if col_idx is not None:
+            col_map[target] = col_idx
+
+    # 최종지분 특별 처리 (기존 로직 유지하되 더 정확하게)
+    if "최종지분" not in col_map:
+        idx_최종 = None
+        idx_지분 = None
+        for idx, val in merged_header.items():
+            val_str = str(val).strip()
+            if val_str == "최종":
+                idx_최종 = idx
+            elif val_str == "지분":
+                idx_지분 = idx
+        
+        if idx_최종 is not None and idx_지분 is not None and abs(idx_최종 - idx_지분) <= 2:
+            col_map["최종지분"] = (min(idx_최종, idx_지분), max(idx_최종, idx_지분))
+
+    # 최종지분 열 바로 옆 헤더가 비어 있으면 그 열 값도 이어 붙임
+    jibun_next_col = None
+    idx = col_map.get("최종지분")
+    if isinstance(idx, int) and (idx + 1) in merged_header and not str(merged_header.get(idx + 1, "")).strip():
+        jibun_next_col = idx + 1
+    return col_map, jibun_next_col
+
+def named_cols_plan(header_row, col_keywords):
+    """섹션 첫 행(셀 병합 전)으로 extract_named_cols의 헤더 해석 결과 조회 (HEADER_PLANS 캐시)"""
+    return HEADER_PLANS.lookup(
+        ("named", tuple(col_keywords)), merge_adjacent_cells(header_row, max_gap=3),
+        lambda merged_header: resolve_named_cols(merged_header, col_keywords)
+    )
+
+def section_column_texts(section, data, label, skip_na=False):
+    """데이터 행 배열(data)에서 열 하나를 잘라 str(값).strip() 목록으로 (skip_na면 빈 셀은 "")"""
+    column = data[:, section.columns.get_loc(label)]
+    texts = _strip_cells(column)
+    if skip_na:
+        texts[pd.isna(column)] = ""
+    return list(texts)
+
+# 소유지분현황(갑구)에서 필요한 열을 추출
+def extract_named_cols(section, col_keywords, plan=None):
+    """
+    plan: 헤더 해석 결과 (col_map, 최종지분 옆 빈 헤더 열)
+    레이아웃 지문으로 찾은 추출 계획이 있으면 넘기고, 없으면 헤더에서 해석
+    """
+    if section.empty:
+        return pd.DataFrame([["기록없음"]])
+    
+    # 셀 병합 적용 (헤더와 데이터 구분)
+    section = merge_dataframe_cells(section)
+    
+    # 같은 헤더 배치는 한 번만 해석 (deunggi.layout.HEADER_PLANS)
+    if plan is None:
+        plan = HEADER_PLANS.lookup(
+            ("named", tuple(col_keywords)), section.iloc[0],
+            lambda header_row: resolve_named_cols(header_row, col_keywords)
+        )
+    col_map, jibun_next_col = plan
+
+    # 헤더 아래 데이터 행을 열 단위로 잘라 문자열로 변환
+    data = section.to_numpy(dtype=object)[1:]
+    empty = [""] * len(data)
+    columns = {}
+    for key in col_keywords:
+        if key == "최종지분":
+            if isinstance(col_map.get("최종지분"), tuple):
+                idx1, idx2 = col_map["최종지분"]
+                val1 = section_column_texts(section, data, idx1)
+                val2 = section_column_texts(section, data, idx2)
+                columns[key] = [v1 + v2 if v1 and v2 else v1 or v2 for v1, v2 in zip(val1, val2)]
+            elif isinstance(col_map.get("최종지분"), int):
+                val1 = section_column_texts(section, data, col_map["최종지분"])
+                # 인접 셀 확인은 헤더가 비어있을 때만
+                val2 = empty
+                if jibun_next_col is not None:
+                    val2 = section_column_texts(section, data, jibun_next_col)
+                columns[key] = [v1 + v2 if v1 and v2 else v1 for v1, v2 in zip(val1, val2)]
+            else:
+                columns[key] = empty
+        elif key in col_map:
+            columns[key] = section_column_texts(section, data, col_map[key], skip_na=True)
+        else:
+            columns[key] = empty
+
+    rows = []
+    for i in range(len(data)):
+        row_dict = {key: columns[key][i] for key in col_keywords}
+        
+        # 데이터 정리: 등기명의인에 다른 정보가 섞여있는 경우 분리
+        if "등기명의인" in row_dict:
+            owner_text = str(row_dict["등기명의인"]).strip()
+            
+            # 주민등록번호 분리
+            if "(주민)등록번호" in col_keywords:
+                jumin = extract_jumin_number(owner_text)
+                if jumin:
+                    row_dict["(주민)등록번호"] = jumin
+                    owner_text = owner_text.replace(jumin, "").strip()
+            
+            # 지분 정보 분리
+            if "최종지분" in col_keywords and not row_dict.get("최종지분"):
+                extracted_jibun = extract_jibun(owner_text)
+                if extracted_jibun:
+                    row_dict["최종지분"] = extracted_jibun
+                    owner_text = owner_text.replace(extracted_jibun, "").strip()
+            
+            # 주소 정보 분리
+            if "주소" in col_keywords and not row_dict.get("주소"):
+                if is_address_pattern(owner_text):
+                    # 이름과 주소를 분리하려고 시도
+                    parts = owner_text.split()
+                    if len(parts) > 1:
+                        # 첫 번째 부분이 이름이고 나머지가 주소일 가능성
+                        possible_name = parts[0]
+                        possible_address = " ".join(parts[1:])
+                        if is_address_pattern(possible_address):
+                            row_dict["등기명의인"] = possible_name.replace(" ", "")  # 이름 띄어쓰기 제거
+                            row_dict["주소"] = possible_address
+                            continue
+            
+            # 정리된 등기명의인 설정 (띄어쓰기 제거)
+            row_dict["등기명의인"] = owner_text.replace(" ", "")
+            
+        rows.append(row_dict)
+    
+    return pd.DataFrame(rows)
+
+def find_keyword_header(section, col_keywords, max_search_rows=15):
+    section = section.fillna("").astype(str)
+    for i in range(min(max_search_rows, len(section))):
+        row = section.iloc[i]
+        match_count = sum(any(keyword_match_exact(cell, kw) for cell in row) for kw in col_keywords)
+        if match_count >= 3:
+            return i, row
+    return None, None
+
+def find_col_index(header_row, keyword):
+    for idx, val in header_row.items():
+        if keyword_match_exact(val, keyword):
+            return idx
+    return None
+
+def resolve_precise_cols(header_row, col_keywords):
+    """extract_precise_named_cols의 헤더 해석: {키워드: 열 이름} (정확 일치 우선, 없으면 부분 일치)"""
+    header_row = merge_split_headers(header_row)
+    col_map = {}
+    for key in col_keywords:
+        idx = find_col_index(header_row, key)
+        # fallback to partial match if exact failed
+        if idx is None:
+            for i, val in header_row.items():
+                if keyword_match_partial(val, key):
+                    idx = i
+                    break
+        if idx is not None:
+            col_map[key] = idx
+    return col_map
+
+def precise_cols_plan(header_row, col_keywords):
+    """섹션 첫 행으로 extract_precise_named_cols의 헤더 해석 결과 조회 (HEADER_PLANS 캐시)"""
+    return HEADER_PLANS.lookup(
+        ("precise", tuple(col_keywords)), header_row,
+        lambda header_row: resolve_precise_cols(header_row, col_keywords)
+    )
+
+# 소유권사항 (갑구)와 에서 필요한 열 추출
+def extract_precise_named_cols(section, col_keywords, plan=None):
+    """plan: 헤더 해석 결과 {키워드: 열 이름} (없으면 헤더에서 해석)"""
+    # always use first row as header
+    col_map = plan if plan is not None else precise_cols_plan(section.iloc[0], col_keywords)
+    start_row = 1
+
+    if not col_map:
+       # 모든 컬럼에 대해 빈 값을 생성하고, 첫번째 컬럼에만 "기록없음" 표시
+       result = pd.DataFrame(columns=col_keywords)
+       result.loc[0] = [""] * len(col_keywords)
+       result.iloc[0, 0] = "기록없음"
+       return result
+
+    # 해당 열의 정확한 위치에서만 값 가져오기 (열 단위로 잘라서 변환)
+    data = section.to_numpy(dtype=object)[start_row:]
+    if len(data) == 0:
+        return pd.DataFrame([])
+    columns = {}
+    for key in col_keywords:
+        col_idx = col_map.get(key)
+        if col_idx is not None and col_idx < section.shape[1]:
+            column = data[:, col_idx]
+            texts = _strip_cells(column)
+            texts[pd.isna(column)] = ""
+            columns[key] = list(texts)
+        else:
+            columns[key] = [""] * len(data)
+    return pd.DataFrame(columns)
+def merge_same_row_if_amount_separated(df):
+    df = df.copy()
+    for i in range(len(df) - 1):
+        row = df.iloc[i]
+        main = str(row["주요등기사항"])
+
+        if "채권최고액" in main:
+            # 현재 행과 다음 행 모두 병합 텍스트 구성
+            combined_row = list(row.values) + list(df.iloc[i + 1].values)
+            combined_text = " ".join(str(x) for x in combined_row if pd.notnull(x))
+
+            # 금액 패턴 추출
+            match = re.search(r"금[\d,]+원", combined_text)
+            if match and match.group(0) not in main:
+                df.at[i, "주요등기사항"] = main + " " + match.group(0)
+    return df
+def is_jumin_number(text):
+    """
+    주민등록번호 패턴을 확인하는 함수
+    예: 123456-1234567 또는 123456-*******
+    """
+    if not isinstance(text, str):
+        return False
+    
+    # 주민등록번호 패턴 (숫자6자리-숫자또는*)
+    pattern = re.compile(r'\d{6}-[\d\*]+')
+    return bool(re.search(pattern, text))
+
+def extract_jumin_number(text):
+    """
+    문자열에서 주민등록번호 패턴을 추출
+    """
+    if not isinstance(text, str):
+        return ""
+    
+    pattern = re.compile(r'\d{6}-[\d\*]+')
+    match = re.search(pattern, text)
+    return match.group(0) if match else ""
+
+def is_jibun_pattern(text):
+    """
+    최종지분 패턴을 확인하는 함수
+    예: 1/2, 50%, 3분의 1, 공유1/3, 단독소유 등
+    """
+    if not isinstance(text, str):
+        return False
+    
+    # 텍스트가 비어있으면 지분 패턴 아님
+    if not text.strip():
+        return False
+    
+    # "단독소유" 키워드 확인
+    if "단독소유" in text or "단독" in text:
+        return True
+    
+    # 분수(1/2, 공유1/3) / 퍼센트(50%) / '분의'(3분의 1, 10139.94분의845.0298) 패턴
+    return SHARE_PARSER.find(text) is not None
+
+def is_address_pattern(text):
+    """
+    주소 패턴을 확인하는 함수
+    """
+    if not isinstance(text, str):
+        return False
+    
+    # "단독소유" 키워드가 있으면 주소가 아님
+    if "단독소유" in text or "단독" in text:
+        return False
+    
+    # 주소에 흔히 포함되는 키워드
+    address_keywords = ['시', '도', '군', '구', '읍', '면', '동', '로', '길', '아파트', '빌라', '번지']
+    text_no_space = re.sub(r'\s+', '', text)
+    
+    for kw in address_keywords:
+        if kw in text_no_space:
+            return True
+            
+    return False
+
+def extract_jibun(text):
+    """
+    문자열에서 지분 패턴 추출
+    단독소유, 분수(1/2, 공유1/3), 퍼센트(50%), '분의'(3분의 1) 순서로 확인 (deunggi.share.ShareParser)
+    """
+    if not isinstance(text, str):
+        return ""
+    
+    share = SHARE_PARSER.parse(text)
+    return share.raw if share is not None else ""
+
+def extract_ownership_type(owner_name):
+    """
+    등기명의인 문자열에서 소유구분 정보(소유자, 공유자 등)를 추출하는 함수
+    """
+    if not isinstance(owner_name, str):
+        return "", owner_name
+    
+    # (소유자), (공유자) 패턴 찾기
+    pattern = r'\((소유자|공유자)\)'
+    match = re.search(pattern, owner_name)
+    
+    if match:
+        ownership_type = match.group(1)  # '소유자' 또는 '공유자' 추출
+        clean_name = owner_name.replace(match.group(0), "").strip()  # 패턴 제거
+        return ownership_type, clean_name
+    else:
+        return "", owner_name
+
+def extract_land_type(df):
+    """
+    엑셀 파일에서 토지 지목 정보를 추출하는 함수
+    df: 시트 DataFrame 또는 RegistryDocument
+    """
+    doc = RegistryDocument.of(df)
+    row_texts = doc.row_texts
+    matcher = LAND_TYPE_MATCHER
+    land_type = ""
+
+    # 1. 주요 등기사항 요약 섹션에서 토지 지목 추출 시도 (최우선)
+    summary = parse_summary(doc)
+    if summary.land_type:
+        return summary.land_type
+
+    # 2. 파일 식별자에서 지목 정보 추출 시도
+    identifier = extract_identifier(doc)
+    if LAND_TAG in identifier:
+        found = matcher.occurrences(identifier)
+        # 정확한 매칭: 앞뒤로 공백이나 문장 끝인 경우만
+        land_type = matcher.bounded(identifier, found)
+        # 정확한 매칭이 안 된 경우 [토지] 30자 이내에서 부분 매칭
+        if not land_type:
+            land_type = matcher.near_tag(identifier, found, 30)
+
+    # 3. 데이터프레임 전체에서 찾기 (더 신중하게)
+    if not land_type:
+        for row_text in row_texts:
+            has_tag = LAND_TAG in row_text
+            has_area = "㎡" in row_text or "m²" in row_text
+            if not has_tag and not has_area:
+                continue
+            found = matcher.occurrences(row_text)
+
+            # [토지] 키워드가 있는 행 우선 검색 (정확한 매칭, 안 되면 [토지] 근처 부분 매칭)
+            if has_tag:
+                land_type = matcher.bounded(row_text, found) or matcher.near_tag(row_text, found, 30)
+                if land_type:
+                    return land_type
+
+            # 지목과 면적이 같은 행에 있으면 실제 지목일 가능성 높음
+            if has_area:
+                land_type = matcher.first_present(found)
+                if land_type:
+                    return land_type
+
+    return land_type
+
+def extract_land_area(df):
+    """
+    엑셀 파일에서 토지면적 정보를 추출하는 함수
+    다양한 형식의 면적 표기를 인식
+    df: 시트 DataFrame 또는 RegistryDocument
+    """
+    doc = RegistryDocument.of(df)
+    row_texts = doc.row_texts
+    area = ""
+    land_types = ["염전", "도로", "임야", "유지", "답", "전", "대", "공장용지", "잡종지", "하천", "구거", "제방", "양어장"]
+    
+    # 주요 등기사항 요약 섹션에서 면적 추출 시도
+    summary = parse_summary(doc)
+    if summary.land_area is not None:
+        return summary.land_area
+
+    # 이하 기존 추출 방법 (위 방법이 실패한 경우 실행)
+    # 파일 식별자에서 면적 추출 시도
+    identifier = extract_identifier(doc)
+    if "[토지]" in identifier:
+        # 면적 패턴 찾기: "[토지]" 문장 내에서 숫자 + ㎡ 또는 m² 패턴
+        area_match = AREA_RE.search(identifier)
+        if area_match:
+            return area_match.group(1).replace(',', '')
+    
+    # 데이터프레임 전체에서 찾기
+    for row_text in row_texts:
+        
+        # 토지종류가 있는 행에서 면적 패턴 찾기
+        if any(land_type in row_text for land_type in land_types):
+            # 면적 패턴: 숫자 + ㎡ 또는 m² 패턴
+            area_match = AREA_RE.search(row_text)
+            if area_match:
+                area = area_match.group(1).replace(',', '')
+                break
+            
+        # "[토지]" 패턴이 있는 행에서 찾기
+        if "[토지]" in row_text:
+            area_match = AREA_RE.search(row_text)
+            if area_match:
+                area = area_match.group(1).replace(',', '')
+                break
+    
+    return area
+
+def check_san_in_address(address):
+    """
+    토지주소에 '산'이 있는지 확인하는 함수
+    '산'이 숫자 앞에 있으면 'O', 아니면 'X'
+    """
+    if not isinstance(address, str):
+        return ''
+    
+    # 주소에서 마지막 부분을 가져오기
+    parts = address.split()
+    if not parts:
+        return ''
+    
+    # 주소의 마지막 부분에서 '산' 다음에 숫자가 오는 패턴 확인
+    import re
+    for part in parts:
+        if re.search(r'산\d+', part) or re.search(r'산\s*\d+', part):
+            return '산'
+    return ''
+
+def extract_right_holders(df):
+    """
+    주요등기사항에서 근저당권자와 지상권자 정보를 추출하고, 
+    원본 텍스트에서 해당 정보를 제거하는 함수
+    """
+    df = df.copy()
+    df["근저당권자"] = ""
+    df["지상권자"] = ""
+    
+    for idx, row in df.iterrows():
+        if "주요등기사항" not in row or pd.isna(row["주요등기사항"]):
+            continue
+            
+        main_text = str(row["주요등기사항"])
+        modified_text = main_text
+        
+        # 근저당권자 추출 및 제거
+        mortgage_pattern = r'근저당권자\s*[:：]?\s*([^,\n]*)'
+        mortgage_match = re.search(mortgage_pattern, main_text)
+        if mortgage_match:
+            df.at[idx, "근저당권자"] = mortgage_match.group(1).strip()
+            # 전체 매치 부분을 찾아 제거 (근저당권자: XXX 형태 전체)
+            full_match = mortgage_match.group(0)
+            modified_text = modified_text.replace(full_match, "")
+        
+        # 지상권자 추출 및 제거
+        surface_pattern = r'지상권자\s*[:：]?\s*([^,\n]*)'
+        surface_match = re.search(surface_pattern, modified_text)
+        if surface_match:
+            df.at[idx, "지상권자"] = surface_match.group(1).strip()
+            # 전체 매치 부분을 찾아 제거 (지상권자: XXX 형태 전체)
+            full_match = surface_match.group(0)
+            modified_text = modified_text.replace(full_match, "")
+        
+        # 수정된 텍스트 정리 (앞뒤 공백, 쉼표 정리)
+        modified_text = modified_text.strip()
+        modified_text = re.sub(r',\s*,', ',', modified_text)  # 연속된 쉼표 제거
+        modified_text = re.sub(r'^\s*,\s*|\s*,\s*$', '', modified_text)  # 시작/끝의 쉼표 제거
+        
+        # 정리된 텍스트로 업데이트
+        df.at[idx, "주요등기사항"] = modified_text
+    
+    return df
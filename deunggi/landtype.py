@@ -0,0 +1,80 @@
+"""
+토지 지목 문자열 매처
+
+지목 목록(LAND_TYPES)을 미리 컴파일한 교대 패턴 하나로 행 문자열을 한 번 훑어
+지목별 등장 위치를 모은 뒤, extract_land_type의 근접 규칙([토지] 바로 뒤 / [토지]와의 거리 /
+앞뒤가 한글이 아닌 단독 표기)을 그 위치로 판정합니다.
+여러 지목이 조건을 만족하면 기존과 같이 LAND_TYPES 순서가 앞선 지목을 고릅니다.
+"""
+import re
+
+# 더 구체적이고 긴 단어가 먼저 검사되도록 정렬 (중복 없이, 이 순서가 우선순위)
+LAND_TYPES = (
+    "공장용지", "잡종지", "염전", "도로", "임야", "유지", "하천", "구거", "제방", "양어장",
+    "전", "답", "대", "광천지", "수도용지", "과수원", "목장용지", "학교용지", "종교용지",
+    "주차장", "주유소", "창고용지", "철도용지", "공원", "묘지", "체육용지", "유원지", "사적지",
+)
+
+LAND_TAG = "[토지]"
+# [토지] 뒤에 한글이 아닌 문자를 건너뛰고 처음 나오는 한글 단어 (겹치는 [토지]도 모두 확인)
+LAND_TAG_WORD = re.compile(r"\[토지\](?=[^가-힣]*([가-힣]+))")
+
+
+def is_hangul(char):
+    return "가" <= char <= "힣"
+
+
+class LandTypeMatcher:
+    """
+    LAND_TYPES 교대 패턴으로 지목 위치를 찾는 매처
+    앞쪽 일치(lookahead)로 모든 시작 위치를 확인하므로 다른 지목 안에 들어 있는 지목("염전"의 "전")도 찾습니다.
+    한 위치에서는 가장 긴 지목 하나만 잡히므로, 한 지목이 다른 지목의 접두어가 되지 않도록 목록을 유지해야 합니다.
+    """
+
+    def __init__(self, land_types=LAND_TYPES):
+        self.land_types = land_types
+        self.priority = {land_type: i for i, land_type in enumerate(land_types)}
+        alternation = "|".join(re.escape(lt) for lt in sorted(land_types, key=len, reverse=True))
+        self.pattern = re.compile(f"(?=({alternation}))")
+
+    def occurrences(self, text):
+        """{지목: [시작 위치, ...]} (등장하지 않은 지목은 없음)"""
+        found = {}
+        for match in self.pattern.finditer(text):
+            found.setdefault(match.group(1), []).append(match.start())
+        return found
+
+    def first_of(self, land_types):
+        """LAND_TYPES 순서로 가장 앞선 지목, 없으면 빈 문자열"""
+        return min(land_types, key=self.priority.__getitem__, default="")
+
+    def first_present(self, found):
+        """문자열에 들어 있는 지목 중 가장 앞선 지목"""
+        return self.first_of(found)
+
+    def bounded(self, text, found):
+        """앞뒤가 문자열 끝이거나 한글이 아닌 문자인 지목 (r'(^|\\s|[^가-힣])' + lt + r'($|\\s|[^가-힣])')"""
+        return self.first_of(
+            land_type for land_type, starts in found.items()
+            if any(self.is_bounded(text, start, len(land_type)) for start in starts)
+        )
+
+    @staticmethod
+    def is_bounded(text, start, length):
+        end = start + length
+        return (start == 0 or not is_hangul(text[start - 1])) and (end == len(text) or not is_hangul(text[end]))
+
+    def near_tag(self, text, found, distance, after_tag=False):
+        """
+        처음 나오는 지목 위치가 처음 나오는 [토지]와 distance자 미만으로 떨어진 지목
+        after_tag: [토지] 뒤 첫 한글 단어가 지목과 같은 경우도 포함 (r'\\[토지\\][^가-힣]*' + lt + ...)
+        """
+        land_index = text.find(LAND_TAG)
+        tag_words = {match.group(1) for match in LAND_TAG_WORD.finditer(text)} if after_tag else ()
+        return self.first_of(
+            land_type for land_type, starts in found.items()
+            if land_type in tag_words or abs(starts[0] - land_index) < distance
+        )
+
+
+LAND_TYPE_MATCHER = LandTypeMatcher()
@@ -0,0 +1,90 @@
+"""
+섹션 헤더 배치 캐시와 레이아웃 지문
+
+인터넷등기소 열람용 엑셀은 몇 가지 헤더 배치가 수천 개 파일에서 반복됩니다.
+헤더 행 서명(열 위치별 셀 문자열)이 같으면 분리 헤더 병합·키워드 매칭 결과(col_map)도 같으므로
+처음 한 번만 계산하고 이후에는 저장된 결과를 사용합니다.
+캐시는 프로세스마다 따로 있으며, 적중 수는 ParsedRegistry에 기록되어 process_batch에서 합산됩니다.
+
+레이아웃 지문: 시트 열 수 + 세 섹션(소유지분현황/소유권사항/을구) 헤더 행 서명
+지문이 같은 파일은 같은 추출 계획(ExtractionPlan, 섹션별 열 매핑)을 그대로 사용하고,
+처음 보는 지문이면 기존 휴리스틱으로 헤더를 해석해 계획을 만듭니다.
+"""
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+DEFAULT_MAX_PLANS = 1024
+
+
+def header_signature(header_row):
+    """헤더 행 서명: (열 이름, 셀 문자열) 목록 - 빈 셀(NaN)은 None"""
+    return tuple(
+        (idx, None if not isinstance(val, str) and pd.isnull(val) else str(val))
+        for idx, val in header_row.items()
+    )
+
+
+class HeaderPlanCache:
+    """
+    (용도, 헤더 행 서명) → 헤더 해석 결과 캐시 (최근 사용 순으로 max_entries개 유지)
+    해석 결과는 여러 파일이 함께 쓰므로 호출한 쪽에서 수정하지 않아야 함
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_PLANS):
+        self.max_entries = max_entries
+        self.plans = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, kind, header_row, resolve):
+        """저장된 해석 결과를 반환하고, 없으면 resolve(header_row)로 만들어 저장"""
+        return self.get_or_resolve((kind, header_signature(header_row)), lambda: resolve(header_row))
+
+    def get_or_resolve(self, key, resolve):
+        """key로 저장된 결과를 반환하고, 없으면 resolve()로 만들어 저장"""
+        plan = self.plans.get(key)
+        if plan is not None:
+            self.plans.move_to_end(key)
+            self.hits += 1
+            return plan
+        self.misses += 1
+        plan = resolve()
+        self.plans[key] = plan
+        if len(self.plans) > self.max_entries:
+            self.plans.popitem(last=False)
+        return plan
+
+    def stats(self):
+        """조회 적중/실패 수와 저장된 배치 수"""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.plans)}
+
+
+# extract_named_cols / extract_precise_named_cols가 함께 쓰는 프로세스 전역 캐시
+HEADER_PLANS = HeaderPlanCache()
+
+
+@dataclass
+class ExtractionPlan:
+    """
+    레이아웃 지문 1개에 대한 추출 계획
+    sections: {섹션 이름: 헤더 해석 결과} - extract_named_cols/extract_precise_named_cols의 plan 인자
+    missing: 헤더에서 찾지 못한 열 ["섹션:열"] (검토용)
+    """
+    fingerprint: str
+    column_count: int
+    sections: dict = field(default_factory=dict)
+    missing: list = field(default_factory=list)
+
+
+def layout_fingerprint(column_count, section_headers):
+    """
+    열 수와 섹션별 헤더 행 서명으로 만든 레이아웃 지문 (16자리 16진수)
+    section_headers: {섹션 이름: 헤더 행 Series, 섹션이 없으면 None}
+    """
+    parts = [column_count]
+    for name, header_row in section_headers.items():
+        parts.append((name, None if header_row is None else header_signature(header_row)))
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,201 @@
+"""
+기존 통합 결과에 새 등기부 증분 병합
+
+이전에 만든 통합 결과(등기사항_통합_시트별구성.xlsx, 통합_결과.zip 또는 표_데이터 폴더)를 읽어
+새로 올린 엑셀 파일만 파싱한 결과와 합칩니다. 새 결과에 나오는 토지주소의 기존 행은 시트마다 모두 빼고
+새 행으로 바꾸며(토지주소 단위 교체), 나머지 기존 행은 그대로 두고 시트를 다시 작성합니다.
+기존 결과의 행은 시트 작성 전 형태(소유지분현황의 "산" 열 제외, 저당권사항의 기록유무 → 순위번호·등기목적)로
+되돌려 새 파일 결과와 같은 정렬·열 구성 과정을 거칩니다.
+"""
+import hashlib
+import os
+import re
+import tempfile
+import zipfile
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from .cache import update_hash
+from .engine import EXCEL_RESULT_NAME, EXPORT_DIR_NAME
+from .export import EXPORT_NAMES, format_available
+from .writer import DJG_SHEET, SYG_SHEET, SZJ_SHEET
+
+# ConsolidatedResult 섹션 이름: 시트 이름
+SECTION_SHEETS = {"szj": SZJ_SHEET, "syg": SYG_SHEET, "djg": DJG_SHEET}
+# 이어지는 시트 이름 ("시트 이름 (2)")
+CONTINUATION_RE = re.compile(r"^(.*) \((\d+)\)$")
+# 표 데이터 읽기 순서 (형식, 확장자) - 타입이 보존되는 형식 우선
+SIDECAR_FORMATS = [("parquet", ".parquet"), ("feather", ".feather"), ("csv", ".csv")]
+# CSV 표 데이터에서 숫자로 되돌릴 열
+NUMERIC_COLUMNS = ["최종지분 수치화"]
+
+
+def source_sheet(title):
+    """작성한 시트 이름의 원래 시트 이름 (모르는 시트면 None)"""
+    if title in EXPORT_NAMES:
+        return title
+    match = CONTINUATION_RE.match(title)
+    if match and match.group(1) in EXPORT_NAMES:
+        return match.group(1)
+    return None
+
+
+def read_workbook_tables(path):
+    """통합 워크북의 시트별 DataFrame {시트 이름: DataFrame} (이어지는 시트는 합침, 기록없음 시트는 제외)"""
+    wb = load_workbook(path, read_only=True)
+    rows_by_sheet = {}
+    columns_by_sheet = {}
+    try:
+        for ws in wb.worksheets:
+            sheetname = source_sheet(ws.title)
+            if sheetname is None:
+                continue
+            rows = ws.iter_rows(values_only=True)
+            header = list(next(rows, ()))
+            if header[:1] == ["기록없음"] or not header:
+                continue
+            if sheetname == SZJ_SHEET and "등기명의인" not in header:
+                # 그룹 헤더(2줄)면 두 번째 행이 열 이름
+                header = list(next(rows, ()))
+            width = len(header)
+            data = rows_by_sheet.setdefault(sheetname, [])
+            columns_by_sheet.setdefault(sheetname, header)
+            for row in rows:
+                row = (list(row) + [None] * width)[:width]
+                if any(value is not None for value in row):
+                    data.append(row)
+    finally:
+        wb.close()
+    return {
+        sheetname: pd.DataFrame(rows, columns=columns_by_sheet[sheetname], dtype=object)
+        for sheetname, rows in rows_by_sheet.items()
+    }
+
+
+def number_or_text(value):
+    """CSV 문자열을 숫자로 (파이썬 float로 읽어 저장한 값과 같게), 숫자가 아니면 그대로"""
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def read_csv_table(path):
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig").astype(object)
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map(number_or_text)
+    return df
+
+
+def sidecar_paths(folder):
+    """
+    표 데이터 폴더에서 읽을 형식과 파일 (형식 이름, {시트 이름: 경로})
+    SIDECAR_FORMATS 순서로 읽을 수 있는 형식 중 파일이 있는 첫 형식, 없으면 (None, {})
+    """
+    for name, suffix in SIDECAR_FORMATS:
+        if not format_available(name):
+            continue
+        paths = {
+            sheetname: os.path.join(folder, file_name + suffix)
+            for sheetname, file_name in EXPORT_NAMES.items()
+            if os.path.isfile(os.path.join(folder, file_name + suffix))
+        }
+        if paths:
+            return name, paths
+    return None, {}
+
+
+def read_sidecar_tables(folder):
+    """표 데이터 폴더의 시트별 DataFrame, 읽을 수 있는 형식의 파일이 없으면 None"""
+    readers = {"parquet": pd.read_parquet, "feather": pd.read_feather, "csv": read_csv_table}
+    name, paths = sidecar_paths(folder)
+    if name is None:
+        return None
+    return {sheetname: readers[name](path) for sheetname, path in paths.items()}
+
+
+def load_consolidated(path):
+    """
+    기존 통합 결과의 시트별 DataFrame {시트 이름: DataFrame}
+    path: 통합 워크북(.xlsx), 통합 결과 ZIP(표_데이터가 있으면 그것을, 없으면 워크북을 읽음) 또는 표_데이터 폴더
+    """
+    if os.path.isdir(path):
+        tables = read_sidecar_tables(path)
+        if tables is None:
+            raise ValueError(f"표 데이터 파일이 없습니다: {path}")
+        return tables
+    if not zipfile.is_zipfile(path):
+        raise ValueError(f"통합 워크북이나 통합 결과 ZIP이 아닙니다: {path}")
+    with zipfile.ZipFile(path) as z:
+        names = z.namelist()
+        if "[Content_Types].xml" in names:
+            return read_workbook_tables(path)
+        with tempfile.TemporaryDirectory() as work_dir:
+            sidecar = [name for name in names if name.startswith(EXPORT_DIR_NAME + "/")]
+            if sidecar:
+                z.extractall(work_dir, members=sidecar)
+                tables = read_sidecar_tables(os.path.join(work_dir, EXPORT_DIR_NAME))
+                if tables is not None:
+                    return tables
+            if EXCEL_RESULT_NAME not in names:
+                raise ValueError(f"통합 결과 ZIP에 {EXCEL_RESULT_NAME}이 없습니다: {path}")
+            z.extract(EXCEL_RESULT_NAME, work_dir)
+            return read_workbook_tables(os.path.join(work_dir, EXCEL_RESULT_NAME))
+
+
+def source_frame(sheetname, df):
+    """시트에 쓴 형태의 DataFrame을 파일별 결과(시트 작성 전) 형태로 되돌림"""
+    df = df.astype(object).where(df.notna(), None)
+    if sheetname == SZJ_SHEET:
+        df = df.drop(columns=["산"], errors="ignore")
+        df["그룹정보"] = "있음"
+    elif sheetname == DJG_SHEET and "기록유무" in df.columns:
+        # 기록유무는 등기목적(없으면 "기록없음")이므로 등기목적으로 되돌리면 같은 값이 다시 만들어짐
+        position = df.columns.get_loc("기록유무")
+        records = df.pop("기록유무")
+        df.insert(position, "등기목적", records)
+        df.insert(position, "순위번호", records)
+    return df
+
+
+def merge_existing(result, tables):
+    """
+    새 파일 파싱 결과(ConsolidatedResult)에 기존 통합 결과 tables(load_consolidated)를 합침
+    새 결과에 나오는 토지주소의 기존 행은 모두 빼고, 남은 기존 행을 result.base로 지정
+    교체한 토지주소 목록을 반환
+    """
+    new_addresses = set()
+    for registry in result.registries:
+        for section in SECTION_SHEETS:
+            df = getattr(registry, section)
+            if df is not None and "토지주소" in df.columns:
+                new_addresses.update(df["토지주소"].dropna().astype(str))
+
+    base = {}
+    replaced = set()
+    for section, sheetname in SECTION_SHEETS.items():
+        df = tables.get(sheetname)
+        if df is None or "토지주소" not in df.columns:
+            continue
+        df = source_frame(sheetname, df)
+        addresses = df["토지주소"].map(lambda value: None if value is None else str(value))
+        stale = addresses.isin(new_addresses)
+        replaced.update(addresses[stale])
+        base[section] = df[~stale].reset_index(drop=True)
+    result.base = base
+    return sorted(replaced)
+
+
+def merge_source_key(path):
+    """기존 통합 결과 내용 키 (결과 캐시 키용, 폴더면 read_sidecar_tables가 읽을 파일의 이름·내용만 해시)"""
+    h = hashlib.sha256()
+    if os.path.isdir(path):
+        _, paths = sidecar_paths(path)
+        for sheetname in sorted(paths):
+            h.update(os.path.basename(paths[sheetname]).encode("utf-8") + b"\0")
+            update_hash(h, paths[sheetname])
+    else:
+        update_hash(h, path)
+    return h.hexdigest()
@@ -0,0 +1,158 @@
+"""
+등기부등본 PDF 첫 페이지에서 토지 주소를 찾아 파일명을 일괄 변경하는 함수 모음
+"""
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from PyPDF2 import PdfReader
+
+from .summary import RunSummary
+
+
+# 주소 추출 정규표현식 패턴 (더 포괄적으로 수정)
+# 기존 패턴 (충청남도 서산시 대산읍 전용) - 산 지번 포함
+pattern_specific = re.compile(r'\[토지\]\s*(충청남도\s*서산시\s*대산읍\s*[가-힣]+리)\s*(산?\d+(?:-\d+)?)')
+
+# 동/리로 끝나는 일반적인 패턴 (가장 많이 사용됨) - 산 지번 포함
+pattern_dong_ri = re.compile(r'\[토지\]\s*([가-힣]+[도시군구광역]\s*[가-힣]+[시군구]\s*[가-힣]+[읍면동리])\s*(산?\d+(?:-\d+)?)')
+
+# 더 구체적인 패턴들 - 산 지번 포함
+pattern_gwangyeoksi = re.compile(r'\[토지\]\s*([가-힣]+광역시\s*[가-힣]+구\s*[가-힣]+동)\s*(산?\d+(?:-\d+)?)')
+pattern_si_gu_dong = re.compile(r'\[토지\]\s*([가-힣]+시\s*[가-힣]+구\s*[가-힣]+동)\s*(산?\d+(?:-\d+)?)')
+pattern_gun_eup_ri = re.compile(r'\[토지\]\s*([가-힣]+[도]\s*[가-힣]+[군]\s*[가-힣]+[읍면]\s*[가-힣]+리)\s*(산?\d+(?:-\d+)?)')
+
+# 가장 유연한 패턴 (공백과 특수문자 고려) - 산 지번 포함
+pattern_flexible = re.compile(r'\[토지\][\s]*([가-힣\s]+[도시군구광역][\s]*[가-힣\s]+[시군구][\s]*[가-힣\s]+[읍면동리])[\s]*(산?\d+(?:-\d+)?)')
+
+# 산 지번 전용 패턴 (더 명확한 매칭을 위해)
+pattern_san_specific = re.compile(r'\[토지\]\s*([가-힣]+[도시군구광역]\s*[가-힣]+[시군구]\s*[가-힣]+[읍면동리])\s*산\s*(\d+(?:-\d+)?)')
+pattern_san_flexible = re.compile(r'\[토지\][\s]*([가-힣\s]+[도시군구광역][\s]*[가-힣\s]+[시군구][\s]*[가-힣\s]+[읍면동리])[\s]*산[\s]*(\d+(?:-\d+)?)')
+
+def extract_address_from_pdf_text(text):
+    """
+    PDF 텍스트에서 주소를 추출하는 함수 (여러 패턴 시도)
+    산 지번도 포함하여 처리
+    """
+    patterns = [
+        (pattern_san_specific, "산지번 특정패턴"),
+        (pattern_san_flexible, "산지번 유연패턴"),
+        (pattern_specific, "특정패턴(서산)"),
+        (pattern_gwangyeoksi, "광역시패턴"),
+        (pattern_si_gu_dong, "시구동패턴"),
+        (pattern_gun_eup_ri, "군읍리패턴"),
+        (pattern_dong_ri, "동리패턴"),
+        (pattern_flexible, "유연패턴")
+    ]
+    
+    for pattern, pattern_type in patterns:
+        match = pattern.search(text)
+        if match:
+            address = match.group(1)
+            # 연속된 공백을 하나의 공백으로 통일
+            address = re.sub(r'\s+', ' ', address)
+            lot_no = match.group(2)
+            
+            # 산 지번의 경우 파일명에 "산" 포함
+            if "산지번" in pattern_type:
+                lot_no = f"산{lot_no}"
+            elif lot_no.startswith("산"):
+                # 이미 "산"으로 시작하는 경우는 그대로 유지
+                pass
+            
+            return address, lot_no, pattern_type
+    
+    return None, None, None
+
+def read_pdf_address(full_path):
+    """
+    PDF 1개의 첫 페이지에서 주소를 찾아 새 파일명을 만드는 함수 (파일명 변경은 하지 않음)
+    프로세스 풀에서도 실행할 수 있도록 결과만 반환
+    반환: (새 파일명, 패턴 종류, 실패 유형, 실패 사례 설명)
+    """
+    try:
+        reader = PdfReader(full_path)
+
+        # PDF가 비어있는지 확인
+        if len(reader.pages) == 0:
+            return None, None, "PDF 페이지 없음", "PDF 페이지 없음"
+
+        first_page_text = reader.pages[0].extract_text()
+
+        # 텍스트 추출 실패 확인
+        if not first_page_text or first_page_text.strip() == "":
+            return None, None, "텍스트 추출 실패", "텍스트 추출 실패"
+
+        # 새로운 주소 추출 함수 사용
+        address, lot_no, pattern_type = extract_address_from_pdf_text(first_page_text)
+
+        if address and lot_no:
+            return f"{address}_{lot_no}.pdf", pattern_type, None, None
+        return None, None, "주소 패턴 미발견", "주소 패턴 미발견"
+
+    except Exception as e:
+        return None, None, f"처리 오류: {type(e).__name__}", f"{str(e)[:50]}..."
+
+
+def iter_pdf_addresses(paths, workers=1):
+    """read_pdf_address 결과를 입력 순서대로 생성 (workers > 1이면 프로세스 풀 사용)"""
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield read_pdf_address(path)
+        return
+
+    chunksize = max(1, min(16, len(paths) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(read_pdf_address, paths, chunksize=chunksize)
+
+
+def process_pdf_files(folder_path, progress=None, workers=1):
+    """
+    PDF 파일들의 파일명을 주소 기반으로 변경하는 함수
+    progress(done, total) 콜백으로 진행률을 알리고, 결과 요약(RunSummary)을 반환
+    workers > 1이면 텍스트 추출과 주소 매칭을 프로세스 풀에서 수행하고,
+    파일명 변경과 중복 확인은 입력 순서대로 이 함수에서만 수행
+    """
+    summary = RunSummary()
+    pdf_files = [f for f in os.listdir(folder_path) if f.lower().endswith(".pdf")]
+    summary.total = len(pdf_files)
+    full_paths = [os.path.join(folder_path, f) for f in pdf_files]
+
+    scanned = iter_pdf_addresses(full_paths, workers=workers)
+    for i, (filename, full_path, (new_filename, pattern_type, error_type, detail)) in enumerate(
+            zip(pdf_files, full_paths, scanned)):
+        if error_type:
+            summary.add_failure(error_type, f"{filename} - {detail}")
+        else:
+            new_path = os.path.join(folder_path, new_filename)
+            try:
+                # 파일명 중복 방지
+                if not os.path.exists(new_path):
+                    os.rename(full_path, new_path)
+                    summary.add_success(f"{filename} → {new_filename} ({pattern_type})")
+                else:
+                    error_type = "파일명 중복"
+                    summary.add_failure(error_type, f"{filename} - {error_type}")
+            except Exception as e:
+                summary.add_failure(f"처리 오류: {type(e).__name__}", f"{filename} - {str(e)[:50]}...")
+
+        if progress is not None:
+            progress(i + 1, summary.total)
+
+    return summary
+
+def extract_and_process_pdf_zip(zip_file, extract_to, output_zip, progress=None, workers=1):
+    # 압축 해제
+    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+        zip_ref.extractall(extract_to)
+    # PDF 파일 처리
+    summary = process_pdf_files(extract_to, progress=progress, workers=workers)
+    # 결과 압축파일 생성
+    with zipfile.ZipFile(output_zip, 'w') as zip_out:
+        for root, _, files in os.walk(extract_to):
+            for file in files:
+                full_path = os.path.join(root, file)
+                arcname = os.path.relpath(full_path, extract_to)
+                zip_out.write(full_path, arcname)
+    return summary
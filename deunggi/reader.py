@@ -0,0 +1,123 @@
+"""
+등기부 엑셀 파일의 첫 시트를 DataFrame 격자로 읽는 리더 모음
+
+- "pandas": pd.ExcelFile(path).parse(첫 시트) - 기존 방식
+- "openpyxl": openpyxl read_only + values_only 스트리밍
+  셀 객체를 만들지 않고 값만 행 단위로 읽어 같은 격자를 만듭니다.
+- "openpyxl-early": openpyxl 스트리밍 + 조기 종료
+  을구 섹션(3. (근)저당권 및 전세권 등)의 끝 표시(참고/비고/총계/전산자료) 행까지만 읽습니다.
+  추출에 쓰이는 섹션은 모두 그 앞에 있으므로 뒤쪽 행은 읽지 않습니다.
+
+모든 리더는 pandas와 같은 규칙(첫 행은 열 이름, 빈 셀은 "")의 DataFrame을 반환합니다.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+
+from .extract import DJG_SECTION_START, DJG_SECTION_END
+
+DEFAULT_READER = "openpyxl-early"
+
+_DJG_START = re.sub(r"\s+", "", DJG_SECTION_START)
+_DJG_END = {re.sub(r"\s+", "", kw) for kw in DJG_SECTION_END}
+
+
+def read_sheet_pandas(path):
+    xls = pd.ExcelFile(path)
+    return xls.parse(xls.sheet_names[0]).fillna("")
+
+
+def convert_value(value):
+    """pandas openpyxl 리더의 셀 변환 규칙과 동일 (정수로 떨어지는 실수는 int)"""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        as_int = int(value)
+        return as_int if as_int == value else value
+    if isinstance(value, str) and value in ERROR_CODES:
+        return np.nan
+    return value
+
+
+def iter_sheet_rows(path):
+    """첫 시트의 행을 값 목록으로 하나씩 생성 (뒤쪽 빈 셀 제거)"""
+    wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        ws = wb.worksheets[0]
+        ws.reset_dimensions()
+        for values in ws.iter_rows(values_only=True):
+            row = [convert_value(v) for v in values]
+            while row and row[-1] == "":
+                row.pop()
+            yield row
+    finally:
+        wb.close()
+
+
+def rows_to_frame(rows):
+    """행 목록을 pd.ExcelFile.parse와 같은 방식(첫 행 = 열 이름)으로 DataFrame 변환"""
+    # 뒤쪽 빈 행 제거 후 가장 긴 행 길이에 맞춰 채움
+    last_row_with_data = -1
+    for i, row in enumerate(rows):
+        if row:
+            last_row_with_data = i
+    data = rows[:last_row_with_data + 1]
+    if not data:
+        return pd.DataFrame()
+    max_width = max(len(row) for row in data)
+    data = [row + [""] * (max_width - len(row)) for row in data]
+    try:
+        df = TextParser(data, header=0, skip_blank_lines=False).read()
+    except EmptyDataError:
+        return pd.DataFrame()
+    return df.fillna("")
+
+
+def read_sheet_openpyxl(path):
+    return rows_to_frame(list(iter_sheet_rows(path)))
+
+
+def iter_rows_until_section_end(rows):
+    """
+    을구 섹션 시작 행 이후 처음 나오는 끝 표시 행까지만 생성
+    (extract_section_range(DJG_SECTION_START, DJG_SECTION_END, keyword_match_exact)와 같은 판정)
+    """
+    started = False
+    for i, row in enumerate(rows):
+        yield row
+        # 첫 행은 열 이름이 되어 섹션 검색 대상이 아님
+        if i == 0:
+            continue
+        cells = {re.sub(r"\s+", "", str(cell)) for cell in row if isinstance(cell, str) or not pd.isnull(cell)}
+        if not started:
+            started = _DJG_START in cells
+        elif cells & _DJG_END:
+            return
+
+
+def read_sheet_openpyxl_early(path):
+    rows = iter_sheet_rows(path)
+    try:
+        return rows_to_frame(list(iter_rows_until_section_end(rows)))
+    finally:
+        # 읽다 만 워크북 닫기
+        rows.close()
+
+
+READERS = {
+    "pandas": read_sheet_pandas,
+    "openpyxl": read_sheet_openpyxl,
+    "openpyxl-early": read_sheet_openpyxl_early,
+}
+
+
+def read_registry_sheet(path, reader=DEFAULT_READER):
+    """reader 이름(READERS 키)으로 첫 시트 읽기"""
+    if reader not in READERS:
+        raise ValueError(f"알 수 없는 리더: {reader} (사용 가능: {', '.join(READERS)})")
+    return READERS[reader](path)
@@ -0,0 +1,100 @@
+"""
+최종지분(지분) 문자열 파서
+
+지분 표기 세 가지(분수 1/2, 퍼센트 50%, '분의' 3분의 1)를 미리 컴파일한 패턴 하나로 찾습니다.
+기존 규칙은 종류별로 re.search를 차례로 불러 먼저 찾은 종류(분수 > 퍼센트 > 분의)의 첫 위치를 쓰므로,
+합친 패턴이 찾은 종류보다 우선순위가 높은 표기의 필수 문자('/', '%')가 문자열에 있을 때만
+그 종류를 따로 다시 찾습니다. 대부분의 문자열은 search 한 번(또는 필수 문자 확인만)으로 끝납니다.
+띄어쓰기 없는 '분의'(10139.94분의845.0298)는 '분의' 패턴(\\s*)에 포함됩니다.
+"""
+import re
+from dataclasses import dataclass
+
+FRACTION = r"(?P<fraction>(?:공유)?(?P<fraction_num>\d+)/(?P<fraction_den>\d+))"
+PERCENT = r"(?P<percent>(?P<percent_value>\d+\.?\d*)\s*%)"
+BOONUI = r"(?P<boonui>(?P<boonui_den>\d+\.?\d*)\s*분\s*의\s*(?P<boonui_num>\d+\.?\d*))"
+
+# 세 표기를 한 번에 찾는 패턴 (가장 앞 위치, 같은 위치면 분수 > 퍼센트 > 분의)
+SHARE_PATTERN = re.compile("|".join([FRACTION, PERCENT, BOONUI]))
+# 우선순위가 높은 표기가 뒤쪽에 있는지 확인할 때만 쓰는 종류별 패턴
+KIND_PATTERNS = {
+    "fraction": re.compile(FRACTION),
+    "percent": re.compile(PERCENT),
+}
+# 표기별 필수 문자: 없으면 그 표기는 찾을 필요가 없음
+KIND_MARKERS = {"fraction": "/", "percent": "%", "boonui": "분"}
+
+SOLE = "단독소유"
+
+
+@dataclass
+class Share:
+    """
+    지분 문자열 해석 결과
+    kind: "단독" / "분수" / "퍼센트" / "분의"
+    raw: 원문에서 찾은 지분 표기 (extract_jibun 반환값)
+    span: 원문에서 raw의 위치 (단독소유는 None)
+    decimal: 소수 지분 (분모가 0이면 None)
+    """
+    kind: str
+    raw: str
+    span: tuple = None
+    numerator: float = None
+    denominator: float = None
+    decimal: float = None
+
+
+def ratio(numerator, denominator):
+    return numerator / denominator if denominator != 0 else None
+
+
+class ShareParser:
+    """SHARE_PATTERN 한 번으로 지분 표기를 찾아 Share로 반환"""
+
+    def __init__(self, pattern=SHARE_PATTERN):
+        self.pattern = pattern
+
+    def find(self, text):
+        """분수/퍼센트/'분의' 표기 (단독소유는 보지 않음), 없으면 None"""
+        if not any(marker in text for marker in KIND_MARKERS.values()):
+            return None
+        match = self.pattern.search(text)
+        if match is None:
+            return None
+        # 바깥 그룹(fraction/percent/boonui)이 마지막에 닫히므로 lastgroup이 표기 종류
+        kind = match.lastgroup
+        # 찾은 종류보다 우선순위가 높은 표기가 뒤쪽에 있으면 그 표기를 사용
+        for higher in KIND_MARKERS:
+            if higher == kind:
+                break
+            if KIND_MARKERS[higher] in text:
+                higher_match = KIND_PATTERNS[higher].search(text, match.start())
+                if higher_match is not None:
+                    match, kind = higher_match, higher
+                    break
+        return self.share_of(match, kind)
+
+    @staticmethod
+    def share_of(match, kind):
+        if kind == "fraction":
+            numerator = float(match.group("fraction_num"))
+            denominator = float(match.group("fraction_den"))
+            return Share("분수", match.group(kind), match.span(kind), numerator, denominator, ratio(numerator, denominator))
+        if kind == "percent":
+            value = float(match.group("percent_value"))
+            return Share("퍼센트", match.group(kind), match.span(kind), value, 100.0, value / 100)
+        numerator = float(match.group("boonui_num"))
+        denominator = float(match.group("boonui_den"))
+        return Share("분의", match.group(kind), match.span(kind), numerator, denominator, ratio(numerator, denominator))
+
+    def parse(self, text):
+        """
+        extract_jibun과 같은 규칙: "단독소유"가 있거나 "단독"만 있는 짧은 문자열이면 단독소유,
+        아니면 find 결과
+        """
+        if SOLE in text or ("단독" in text and len(text.strip()) < 10):
+            return Share("단독", SOLE, decimal=1.0)
+        return self.find(text)
+
+
+SHARE_PARSER = ShareParser()
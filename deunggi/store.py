@@ -0,0 +1,184 @@
+"""
+분석 결과 저장소 (SQLite)
+
+배치마다 파싱한 소유지분현황/소유권사항/저당권사항 행을 배치·파일 출처와 함께 한 DB에 쌓아
+여러 배치에 걸쳐 "소유자 X의 토지" 같은 질문을 워크북을 다시 열지 않고 조회합니다.
+    - batches: 배치 (이름, 업로드 ZIP 내용 키, 저장 시각, 파일 수)
+    - files: 배치의 엑셀 파일 (파일명, 식별자, 지목, 토지면적, 오류 종류)
+    - szj / syg / djg: 시트별 행 (batch_id, file_id + 열 이름 그대로), 토지주소·등기명의인·근저당권자 색인
+같은 키의 배치는 한 번만 저장합니다.
+"""
+import hashlib
+import os
+import sqlite3
+import time
+
+import pandas as pd
+
+from .cache import update_hash
+
+DEFAULT_STORE_PATH = os.environ.get(
+    "DEUNGGI_STORE_PATH", os.path.join(os.path.expanduser("~"), ".deunggi", "registry_store.sqlite3")
+)
+
+# 표 이름: (시트 이름, 저장할 열) - 파일 결과에 없는 열은 NULL, 목록에 없는 열은 저장하지 않음
+STORE_TABLES = {
+    "szj": ("소유지분현황", [
+        "토지주소", "등기명의인", "소유구분", "(주민)등록번호", "주소", "순위번호",
+        "최종지분", "최종지분 수치화", "지목", "토지면적", "지분면적",
+    ]),
+    "syg": ("소유권사항", ["토지주소", "순위번호", "등기목적", "접수정보", "주요등기사항", "대상소유자"]),
+    "djg": ("저당권사항", [
+        "토지주소", "순위번호", "등기목적", "접수정보", "주요등기사항", "대상소유자", "근저당권자", "지상권자",
+    ]),
+}
+# 색인할 열 (표 이름: [열])
+STORE_INDEXES = {
+    "szj": ["토지주소", "등기명의인"],
+    "syg": ["토지주소"],
+    "djg": ["토지주소", "근저당권자"],
+}
+# search의 owner가 찾는 열
+OWNER_COLUMNS = {"szj": "등기명의인", "syg": "대상소유자", "djg": "대상소유자"}
+
+
+def batch_key(source):
+    """
+    배치 키: 엑셀 ZIP 내용의 SHA-256 (파일 경로 또는 업로드 파일 객체)
+    캐시 키와 달리 버전·옵션을 섞지 않으므로 코드가 바뀌어도 같은 ZIP은 같은 배치
+    """
+    h = hashlib.sha256()
+    update_hash(h, source)
+    return h.hexdigest()
+
+
+def quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def cell_value(value):
+    """SQLite에 넣을 값 (결측은 NULL)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    # numpy 정수 등은 파이썬 값으로
+    return value.item() if hasattr(value, "item") else value
+
+
+class RegistryStore:
+    """
+    배치별 파싱 결과를 쌓는 SQLite 저장소
+    add_batch로 저장하고 search/query로 조회
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS batches ("
+            " id INTEGER PRIMARY KEY,"
+            " key TEXT UNIQUE,"
+            " name TEXT NOT NULL,"
+            " created REAL NOT NULL,"
+            " files INTEGER NOT NULL)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " id INTEGER PRIMARY KEY,"
+            " batch_id INTEGER NOT NULL REFERENCES batches(id),"
+            " file_name TEXT NOT NULL,"
+            " identifier TEXT, land_type TEXT, land_area TEXT, error_type TEXT)"
+        )
+        for table, (_, columns) in STORE_TABLES.items():
+            column_defs = ", ".join(quote(col) for col in columns)
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                f" batch_id INTEGER NOT NULL REFERENCES batches(id),"
+                f" file_id INTEGER NOT NULL REFERENCES files(id),"
+                f" {column_defs})"
+            )
+            for col in STORE_INDEXES[table]:
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS {quote(f'idx_{table}_{col}')} ON {table}({quote(col)})")
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def has_batch(self, key):
+        return self.conn.execute("SELECT 1 FROM batches WHERE key = ?", (key,)).fetchone() is not None
+
+    def add_batch(self, result, name, key=None):
+        """
+        ConsolidatedResult의 파일별 결과를 배치 하나로 저장하고 batch_id 반환
+        key: 업로드 ZIP 내용 키 - 이미 저장된 키면 저장하지 않고 기존 batch_id 반환
+        """
+        if key is not None:
+            row = self.conn.execute("SELECT id FROM batches WHERE key = ?", (key,)).fetchone()
+            if row:
+                return row[0]
+        with self.conn:
+            batch_id = self.conn.execute(
+                "INSERT INTO batches (key, name, created, files) VALUES (?, ?, ?, ?)",
+                (key, name, time.time(), len(result.registries))
+            ).lastrowid
+            for registry in result.registries:
+                file_id = self.conn.execute(
+                    "INSERT INTO files (batch_id, file_name, identifier, land_type, land_area, error_type)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (batch_id, registry.file_name, registry.name, registry.land_type, registry.land_area,
+                     registry.error_type)
+                ).lastrowid
+                for table in STORE_TABLES:
+                    self.insert_rows(table, getattr(registry, table), batch_id, file_id)
+        return batch_id
+
+    def insert_rows(self, table, df, batch_id, file_id):
+        if df is None or df.empty:
+            return
+        columns = STORE_TABLES[table][1]
+        df = df.reindex(columns=columns)
+        placeholders = ", ".join("?" * (len(columns) + 2))
+        self.conn.executemany(
+            f"INSERT INTO {table} (batch_id, file_id, {', '.join(quote(col) for col in columns)})"
+            f" VALUES ({placeholders})",
+            ([batch_id, file_id, *map(cell_value, row)] for row in df.itertuples(index=False))
+        )
+
+    def batches(self):
+        """저장된 배치 목록 (최근 순) DataFrame"""
+        return self.query(
+            "SELECT id, name, datetime(created, 'unixepoch', 'localtime') AS created, files FROM batches ORDER BY id DESC"
+        )
+
+    def query(self, sql, params=()):
+        """SQL 조회 결과 DataFrame"""
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def search(self, table="szj", address=None, owner=None, mortgagee=None, batch_id=None, exact=False, limit=1000):
+        """
+        table(szj/syg/djg) 행 검색, 배치 이름·파일명을 붙인 DataFrame 반환
+        address: 토지주소, owner: 등기명의인(szj)/대상소유자(syg, djg), mortgagee: 근저당권자(djg)
+        exact: True면 값이 같은 행만 (색인 사용), False면 값이 들어 있는 행
+        """
+        if table not in STORE_TABLES:
+            raise ValueError(f"알 수 없는 표: {table} (사용 가능: {', '.join(STORE_TABLES)})")
+        conditions, params = [], []
+        for col, value in [("토지주소", address), (OWNER_COLUMNS[table], owner), ("근저당권자", mortgagee)]:
+            if not value:
+                continue
+            if col not in STORE_TABLES[table][1]:
+                raise ValueError(f"{STORE_TABLES[table][0]}에는 {col} 열이 없습니다")
+            conditions.append(f"t.{quote(col)} = ?" if exact else f"instr(t.{quote(col)}, ?) > 0")
+            params.append(value)
+        if batch_id is not None:
+            conditions.append("t.batch_id = ?")
+            params.append(batch_id)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        columns = ", ".join(f"t.{quote(col)}" for col in STORE_TABLES[table][1])
+        return self.query(
+            f"SELECT b.name AS 배치, f.file_name AS 파일명, {columns} FROM {table} t"
+            f" JOIN batches b ON b.id = t.batch_id JOIN files f ON f.id = t.file_id"
+            f" {where} ORDER BY t.{quote('토지주소')}, t.rowid LIMIT ?",
+            (*params, limit)
+        )
@@ -0,0 +1,33 @@
+"""
+파일 단위 처리 결과(성공/실패 통계와 샘플)를 모으는 객체
+"""
+from dataclasses import dataclass, field
+
+# 화면에 보여줄 성공/실패 사례 샘플 최대 개수
+SAMPLE_LIMIT = 5
+
+
+@dataclass
+class RunSummary:
+    """엑셀 변환, PDF 파일명 변경 결과 요약"""
+    total: int = 0
+    success_count: int = 0
+    failure_count: int = 0
+    error_summary: dict = field(default_factory=dict)
+    successful_samples: list = field(default_factory=list)
+    failed_samples: list = field(default_factory=list)
+
+    def add_success(self, sample):
+        self.success_count += 1
+        if len(self.successful_samples) < SAMPLE_LIMIT:
+            self.successful_samples.append(sample)
+
+    def add_failure(self, error_type, sample):
+        self.error_summary[error_type] = self.error_summary.get(error_type, 0) + 1
+        if len(self.failed_samples) < SAMPLE_LIMIT:
+            self.failed_samples.append(sample)
+        self.failure_count += 1
+
+    @property
+    def success_rate(self):
+        return (self.success_count / self.total * 100) if self.total > 0 else 0
@@ -0,0 +1,323 @@
+"""
+Streamlit 화면 구성 (app.py / app_main.py 공용)
+엔진(deunggi.engine, deunggi.pdf)을 호출하고 진행률과 결과 요약만 표시합니다.
+"""
+import os
+import tempfile
+from dataclasses import asdict
+
+import streamlit as st
+
+from .cache import DEFAULT_CACHE_DIR, ParseCache, ResultCache, private_dir, result_cache_key
+from .engine import extract_excel_zip, output_options, process_batch, write_result_zip
+from .export import EXPORTERS, format_available
+from .merge import load_consolidated, merge_existing, merge_source_key
+from .pdf import extract_and_process_pdf_zip
+from .reader import DEFAULT_READER, READERS
+from .store import DEFAULT_STORE_PATH, STORE_TABLES, RegistryStore, batch_key
+from .summary import RunSummary
+from .writer import DEFAULT_MAX_ROWS, DEFAULT_WRITER, EXCEL_MAX_ROWS, WRITERS
+
+
+def progress_callback(progress_bar, status_text, label):
+    """엔진의 progress(done, total) 콜백을 진행률 바에 연결"""
+    def update(done, total):
+        progress = done / total
+        progress_bar.progress(progress)
+        status_text.text(f"{label} 중... {done}/{total} ({progress:.1%})")
+    return update
+
+
+def render_summary(title, summary):
+    """성공/실패 통계와 샘플 출력"""
+    st.write("---")
+    st.write(f"## 📊 {title}")
+
+    # 성공/실패 통계
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("✅ 성공", summary.success_count)
+    with col2:
+        st.metric("❌ 실패", summary.failure_count)
+    with col3:
+        st.metric("📁 전체", summary.total)
+
+    # 성공률 표시
+    st.write(f"**성공률: {summary.success_rate:.1f}%**")
+
+    # 성공 사례 샘플 (최대 5개)
+    if summary.successful_samples:
+        st.write("### ✅ 성공 사례 (샘플)")
+        for sample in summary.successful_samples:
+            st.write(f"- {sample}")
+        if summary.success_count > 5:
+            st.write(f"... 외 {summary.success_count - 5}개 더")
+
+    # 실패 유형별 요약
+    if summary.error_summary:
+        st.write("### ❌ 실패 유형별 통계")
+        for error_type, count in summary.error_summary.items():
+            percentage = (count / summary.failure_count * 100) if summary.failure_count > 0 else 0
+            st.write(f"- **{error_type}**: {count}개 ({percentage:.1f}%)")
+
+        # 실패 사례 샘플 (최대 5개)
+        if summary.failed_samples:
+            st.write("### 🔍 실패 사례 (샘플)")
+            for sample in summary.failed_samples:
+                st.write(f"- {sample}")
+            if summary.failure_count > 5:
+                st.write(f"... 외 {summary.failure_count - 5}개 더")
+
+
+def analysis_options():
+    """처리 옵션 입력창, run_analysis에 넘길 옵션 dict 반환"""
+    with st.expander("⚙️ 처리 옵션", expanded=False):
+        workers = st.number_input(
+            "병렬 처리 프로세스 수 (1 = 직렬 처리)",
+            min_value=1, max_value=os.cpu_count() or 1, value=1, step=1
+        )
+        use_cache = st.checkbox("같은 ZIP 재분석 시 이전 결과 재사용 (캐시)", value=True)
+        use_parse_cache = st.checkbox("이전에 분석한 엑셀 파일은 파싱 생략 (파일별 캐시)", value=True)
+        reader = st.selectbox(
+            "엑셀 읽기 방식", list(READERS), index=list(READERS).index(DEFAULT_READER),
+            help="openpyxl: 값만 스트리밍으로 읽음 (빠름), pandas: pd.ExcelFile 전체 로드 (기존 방식)"
+        )
+        writer = st.selectbox(
+            "결과 엑셀 작성 방식", list(WRITERS), index=list(WRITERS).index(DEFAULT_WRITER),
+            help="streaming: 행 단위로 바로 저장 (메모리 적게 사용), openpyxl: 셀을 모두 만든 뒤 저장 (기존 방식), "
+                 "data-only: 그룹 헤더·테두리 없이 값만 저장 (가장 빠름)"
+        )
+        exports = st.multiselect(
+            "표 데이터 함께 저장 (서식 없음)", [name for name in EXPORTERS if format_available(name)],
+            help="시트별 합친 표를 통합 결과 ZIP의 표_데이터 폴더에 저장 (parquet/feather는 pyarrow 설치 시 표시)"
+        )
+        max_rows = st.number_input(
+            "시트 1개의 최대 행 수 (넘으면 토지주소 단위로 이어지는 시트로 나눔)",
+            min_value=3, max_value=EXCEL_MAX_ROWS, value=DEFAULT_MAX_ROWS, step=1000
+        )
+        use_store = st.checkbox("분석 결과를 검색용 저장소에 추가 (배치 간 검색)", value=False)
+        merge_base = st.file_uploader(
+            "기존 통합 결과에 병합 (선택: 등기사항_통합_시트별구성.xlsx 또는 통합_결과.zip)", type=["xlsx", "zip"],
+            key="merge_base",
+            help="올린 엑셀 ZIP의 파일만 파싱해 기존 결과에 합칩니다. 같은 토지주소의 기존 행은 새 결과로 교체됩니다."
+        )
+    return {"workers": int(workers), "use_cache": use_cache, "use_parse_cache": use_parse_cache, "reader": reader,
+            "writer": writer, "max_rows": int(max_rows), "exports": exports, "use_store": use_store,
+            "merge_base": merge_base}
+
+
+def process_excel_zip(uploaded_zip, workers=1, use_parse_cache=False, reader=DEFAULT_READER, writer=DEFAULT_WRITER,
+                      max_rows=DEFAULT_MAX_ROWS, exports=(), store_path=None, merge_tables=None):
+    """
+    엑셀 ZIP을 처리하고 (통합 워크북 경로, 처리 통계, 시트 분할 정보 또는 None, 표 데이터 파일 경로 목록)를 반환
+    store_path: 지정하면 파싱한 행을 그 SQLite 저장소에 배치로 추가
+    merge_tables: 기존 통합 결과(deunggi.merge.load_consolidated) - 지정하면 새 파일 결과를 합쳐 작성
+    """
+    temp_dir = tempfile.mkdtemp()
+    excel_files = extract_excel_zip(uploaded_zip, temp_dir)
+    total_excel_files = len(excel_files)
+
+    progress = None
+    if total_excel_files > 0:
+        # 진행률 표시용 UI
+        excel_progress_bar = st.progress(0)
+        excel_status_text = st.empty()
+        st.write(f"## 📊 엑셀 파일 변환 진행 중...")
+        progress = progress_callback(excel_progress_bar, excel_status_text, "엑셀 처리")
+
+    parse_cache = ParseCache() if use_parse_cache else None
+    try:
+        result = process_batch(excel_files, progress=progress, workers=workers, parse_cache=parse_cache,
+                               reader=reader)
+        plan_stats = result.header_plan_stats
+        lookups = plan_stats["hits"] + plan_stats["misses"]
+        if lookups:
+            st.caption(f"헤더 배치 캐시: 적중 {plan_stats['hits']}회 / 조회 {lookups}회 "
+                       f"({plan_stats['hits'] / lookups:.1%})")
+        if result.layouts:
+            incomplete = sum(1 for layout in result.layouts.values() if layout["missing"])
+            st.caption(f"헤더 레이아웃: {len(result.layouts)}종 (열 누락 {incomplete}종)")
+        if parse_cache is not None and total_excel_files > 0:
+            stats = parse_cache.stats()
+            st.caption(f"파일별 캐시: 적중 {stats['hits']}개 / 새로 파싱 {stats['misses']}개 "
+                       f"(저장 {stats['entries']}개, {stats['bytes'] / 1024 / 1024:.1f}MB)")
+    finally:
+        if parse_cache is not None:
+            parse_cache.close()
+
+    # UI 진행률 바 완료 및 결과 요약 표시
+    if total_excel_files > 0:
+        excel_progress_bar.progress(1.0)
+        excel_status_text.text("엑셀 처리 완료!")
+        render_summary("엑셀 파일 변환 결과", result.summary)
+    else:
+        st.warning("업로드된 ZIP 파일에 Excel 파일(.xlsx)이 없습니다.")
+
+    if store_path and total_excel_files > 0:
+        store = RegistryStore(store_path)
+        try:
+            batch_id = store.add_batch(result, uploaded_zip.name, batch_key(uploaded_zip))
+        finally:
+            store.close()
+        st.caption(f"검색용 저장소에 배치 {batch_id}로 저장했습니다.")
+
+    if merge_tables is not None:
+        replaced = merge_existing(result, merge_tables)
+        st.caption(f"기존 결과에 병합: 토지주소 {len(replaced)}개의 기존 행을 새 파일 결과로 교체했습니다.")
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
+        excel_result_path = tmp.name
+    manifest = result.write_workbook(excel_result_path, writer=writer, max_rows=max_rows)
+    if manifest:
+        split_sheets = [part["sheet"] for part in manifest["sheets"] if part["part"] > 1]
+        st.info(f"시트당 최대 {max_rows}행을 넘어 이어지는 시트로 나눴습니다: {', '.join(split_sheets)}")
+    export_paths = result.export_tables(tempfile.mkdtemp(), exports) if exports else []
+    return excel_result_path, result.summary, manifest, export_paths
+
+
+def process_pdf_zip(uploaded_pdf_zip, workers=1):
+    """PDF ZIP의 파일명을 일괄 변경하고 (결과 ZIP 경로, 처리 통계)를 반환"""
+    temp_pdf_dir = tempfile.mkdtemp()
+    temp_pdf_zip_path = os.path.join(temp_pdf_dir, "input_pdf.zip")
+    with open(temp_pdf_zip_path, "wb") as f:
+        f.write(uploaded_pdf_zip.read())
+    extract_folder = os.path.join(temp_pdf_dir, "extracted")
+    os.makedirs(extract_folder, exist_ok=True)
+    pdf_result_path = os.path.join(temp_pdf_dir, "processed_result_pdf.zip")
+
+    # 진행률 표시용
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    summary = extract_and_process_pdf_zip(
+        temp_pdf_zip_path, extract_folder, pdf_result_path,
+        progress=progress_callback(progress_bar, status_text, "처리"),
+        workers=workers
+    )
+    progress_bar.progress(1.0)
+    status_text.text("처리 완료!")
+    render_summary("PDF 파일명 변경 결과", summary)
+    return pdf_result_path, summary
+
+
+def offer_download(final_zip_path):
+    st.success("✅ 분석 완료! 아래에서 통합 결과 파일을 다운로드하세요.")
+    with open(final_zip_path, "rb") as f:
+        st.download_button("📥 통합 결과 ZIP 다운로드 (엑셀+PDF)", data=f, file_name="통합_결과.zip")
+
+
+def save_upload(uploaded_file):
+    """업로드 파일을 같은 확장자의 임시 파일로 저장하고 경로 반환"""
+    suffix = os.path.splitext(uploaded_file.name)[1]
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        tmp.write(uploaded_file.getvalue())
+    return tmp.name
+
+
+def batch_stored(uploaded_zip, store_path=DEFAULT_STORE_PATH):
+    """업로드한 엑셀 ZIP이 저장소에 이미 배치로 저장됐는지"""
+    if not os.path.exists(store_path):
+        return False
+    store = RegistryStore(store_path)
+    try:
+        return store.has_batch(batch_key(uploaded_zip))
+    finally:
+        store.close()
+
+
+def run_analysis(uploaded_zip, uploaded_pdf_zip, options=None):
+    """분석 시작 버튼: 엑셀 ZIP → 통합 워크북, PDF ZIP → 파일명 변경, 통합 결과 ZIP 다운로드"""
+    options = options or {}
+
+    merge_path = save_upload(options["merge_base"]) if options.get("merge_base") else None
+
+    # 캐시 폴더를 안전하게 쓸 수 없으면(다른 사용자 소유 등) 분석 전에 종료
+    if options.get("use_cache", True) or options.get("use_parse_cache"):
+        try:
+            private_dir(DEFAULT_CACHE_DIR)
+        except PermissionError as e:
+            st.error(str(e))
+            return
+
+    # 0. 같은 ZIP을 이미 분석했으면 저장된 결과를 그대로 사용
+    cache = cache_key = None
+    if options.get("use_cache", True):
+        cache = ResultCache()
+        cache_key = result_cache_key(uploaded_zip, uploaded_pdf_zip, output_options(
+            options.get("writer", DEFAULT_WRITER), options.get("max_rows", DEFAULT_MAX_ROWS), options.get("exports", []),
+            merge_source_key(merge_path) if merge_path else None, options.get("reader", DEFAULT_READER)
+        ))
+        cached = cache.get(cache_key)
+        if cached and options.get("use_store") and not batch_stored(uploaded_zip):
+            # 저장소에 아직 없는 배치는 행을 저장하도록 다시 분석
+            cached = None
+        if cached:
+            final_zip_path, meta = cached
+            st.info("이전에 분석한 ZIP과 내용이 같아 저장된 결과를 불러왔습니다.")
+            render_summary("엑셀 파일 변환 결과", RunSummary(**meta["excel"]))
+            if meta.get("pdf"):
+                render_summary("PDF 파일명 변경 결과", RunSummary(**meta["pdf"]))
+            offer_download(final_zip_path)
+            return
+
+    # 증분 병합할 기존 결과는 파싱 전에 읽어 둠
+    merge_tables = None
+    if merge_path:
+        try:
+            merge_tables = load_consolidated(merge_path)
+        except ValueError as e:
+            st.error(f"기존 통합 결과를 읽을 수 없습니다: {e}")
+            return
+
+    # 1. 엑셀 ZIP 처리
+    excel_result_path, excel_summary, manifest, export_paths = process_excel_zip(
+        uploaded_zip, workers=options.get("workers", 1), use_parse_cache=options.get("use_parse_cache", False),
+        reader=options.get("reader", DEFAULT_READER), writer=options.get("writer", DEFAULT_WRITER),
+        max_rows=options.get("max_rows", DEFAULT_MAX_ROWS), exports=options.get("exports", []),
+        store_path=DEFAULT_STORE_PATH if options.get("use_store") else None, merge_tables=merge_tables
+    )
+
+    # 2. PDF ZIP 처리 (있을 때만)
+    pdf_result_path = pdf_summary = None
+    if uploaded_pdf_zip:
+        pdf_result_path, pdf_summary = process_pdf_zip(uploaded_pdf_zip, workers=options.get("workers", 1))
+
+    # 3. 통합 결과 ZIP 생성 및 다운로드 버튼
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as final_zip:
+        write_result_zip(excel_result_path, pdf_result_path, final_zip.name, manifest, export_paths)
+        if cache is not None:
+            cache.put(cache_key, final_zip.name, {
+                "excel": asdict(excel_summary),
+                "pdf": asdict(pdf_summary) if pdf_summary else None,
+            })
+        offer_download(final_zip.name)
+
+
+def render_store_search(store_path=DEFAULT_STORE_PATH):
+    """검색용 저장소 화면: 시트를 골라 토지주소·명의인·근저당권자로 배치 전체에서 행 검색"""
+    with st.expander("🔎 저장된 분석 결과 검색", expanded=False):
+        if not os.path.exists(store_path):
+            st.info("저장된 분석 결과가 없습니다. 처리 옵션에서 '검색용 저장소에 추가'를 선택하고 분석하세요.")
+            return
+        store = RegistryStore(store_path)
+        try:
+            batches = store.batches()
+            st.caption(f"저장된 배치 {len(batches)}개 / 엑셀 파일 {int(batches['files'].sum())}개")
+            table = st.selectbox("시트", list(STORE_TABLES), format_func=lambda name: STORE_TABLES[name][0])
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                address = st.text_input("토지주소")
+            with col2:
+                owner = st.text_input("등기명의인" if table == "szj" else "대상소유자")
+            with col3:
+                mortgagee = st.text_input("근저당권자", disabled=table != "djg")
+            exact = st.checkbox("값이 정확히 같은 행만 (기본: 입력한 글자가 들어 있는 행)")
+            if not (address or owner or mortgagee):
+                return
+            rows = store.search(table, address=address, owner=owner, mortgagee=mortgagee if table == "djg" else None,
+                                exact=exact)
+        finally:
+            store.close()
+        st.write(f"**{len(rows)}행**" + (" (처음 1000행만 표시)" if len(rows) >= 1000 else ""))
+        st.dataframe(rows, use_container_width=True)
+        st.download_button("📥 검색 결과 CSV 다운로드", data=rows.to_csv(index=False).encode("utf-8-sig"),
+                           file_name="검색_결과.csv", mime="text/csv")
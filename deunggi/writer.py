@@ -0,0 +1,522 @@
+"""
+통합 결과 워크북(시트 3개)을 작성하고 스타일을 적용하는 함수 모음
+
+- "openpyxl": 일반 Workbook에 셀을 모두 만든 뒤 스타일을 적용하고 저장 (기존 방식)
+- "streaming": write_only Workbook에 행을 만들면서 바로 내보냄
+  열 너비·테두리를 데이터에서 미리 계산하고 스타일 객체를 함께 써서 셀 객체를 메모리에 쌓지 않습니다.
+
+두 방식 모두 같은 값·그룹 헤더·토지주소 변경 테두리·열 너비의 워크북을 만듭니다.
+셀 서식은 워크북마다 한 번 등록하는 이름 있는 스타일(NamedStyle: 헤더/데이터/경계 등)을 이름으로 지정합니다.
+"""
+from copy import copy
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.styles import Alignment, PatternFill, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter
+
+from .extract import check_san_in_address
+
+
+# 스타일 구성 요소 (연한 초록색 배경 RGB: 230, 244, 234)
+HEADER_FILL = PatternFill(start_color="E6F4EA", end_color="E6F4EA", fill_type="solid")
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+THIN_SIDE = Side(style='thin', color='000000')
+LIGHT_SIDE = Side(style='thin', color='D3D3D3')
+HEADER_BORDER = Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE)
+DATA_BORDER = Border(left=LIGHT_SIDE, right=LIGHT_SIDE, top=LIGHT_SIDE, bottom=LIGHT_SIDE)
+# 토지주소가 바뀌는 행: 윗 테두리만 검은색 (나머지는 원래 테두리 유지)
+DATA_TOP_BORDER = Border(left=LIGHT_SIDE, right=LIGHT_SIDE, top=THIN_SIDE, bottom=LIGHT_SIDE)
+TOP_BORDER = Border(left=Side(), right=Side(), top=THIN_SIDE, bottom=Side())
+HEADER_ROW_HEIGHT = 25
+
+# 이름 있는 스타일
+HEADER_STYLE = "등기 헤더"                  # 헤더 셀: 가운데 정렬 + 연한 초록색 + 검은 테두리
+HEADER_EDGE_STYLE = "등기 헤더 테두리"       # 병합된 그룹 헤더의 나머지 셀: 테두리만
+DATA_STYLE = "등기 데이터"                  # 그룹 헤더 시트의 데이터 셀: 회색 테두리
+DATA_BOUNDARY_STYLE = "등기 데이터 경계"     # 토지주소가 바뀌는 데이터 행: 회색 테두리 + 검은 윗 테두리
+BOUNDARY_STYLE = "등기 경계"                # 테두리 없는 셀에 검은 윗 테두리
+
+
+def named_styles():
+    """writer가 사용하는 이름 있는 스타일 (NamedStyle은 워크북에 묶이므로 워크북마다 새로 만듦)"""
+    return [
+        NamedStyle(name=HEADER_STYLE, font=copy(DEFAULT_FONT), fill=HEADER_FILL, border=HEADER_BORDER,
+                   alignment=HEADER_ALIGNMENT),
+        NamedStyle(name=HEADER_EDGE_STYLE, font=copy(DEFAULT_FONT), border=HEADER_BORDER),
+        NamedStyle(name=DATA_STYLE, font=copy(DEFAULT_FONT), border=DATA_BORDER),
+        NamedStyle(name=DATA_BOUNDARY_STYLE, font=copy(DEFAULT_FONT), border=DATA_TOP_BORDER),
+        NamedStyle(name=BOUNDARY_STYLE, font=copy(DEFAULT_FONT), border=TOP_BORDER),
+    ]
+
+
+def register_named_styles(wb):
+    """워크북에 아직 없는 writer 스타일을 등록 (여러 번 불러도 됨)"""
+    for style in named_styles():
+        if style.name not in wb.named_styles:
+            wb.add_named_style(style)
+
+
+def cell_length(value):
+    """열 너비 계산용 셀 문자열 길이 (빈 값은 0)"""
+    try:
+        return len(str(value)) if value else 0
+    except Exception:
+        return 0
+
+
+def column_max_length(values):
+    """
+    열 값의 최대 문자열 길이 (str 변환 후 str.len으로 한 번에 계산)
+    빈 값(None/NaN/""/0)은 cell_length가 0으로 세지만 문자열 길이도 8 미만이라
+    최소 너비(10)에 묻히므로 너비 결과는 셀마다 세는 것과 같음
+    """
+    if len(values) == 0:
+        return 0
+    max_length = pd.Series(values, dtype=object).astype(str).str.len().max()
+    return 0 if pd.isna(max_length) else int(max_length)
+
+
+def column_width(max_length):
+    # 최소 10, 최대 50 사이로 너비 조정
+    return min(max(max_length + 2, 10), 50)
+
+
+def change_key(value):
+    """토지주소 경계 비교용 셀 값 (앞뒤 공백을 뺀 문자열, 빈 셀은 "")"""
+    return str(value).strip() if value is not None else ""
+
+
+_change_keys = np.frompyfunc(change_key, 1, 1)
+
+
+def boundary_mask(values):
+    """
+    토지주소(첫 열) 값이 앞 행과 달라지는 행 (첫 행은 항상 True)
+    change_key로 바꾼 값을 한 칸 밀어 앞 행과 한 번에 비교
+    """
+    keys = _change_keys(np.asarray(values, dtype=object))
+    if len(keys) == 0:
+        return np.zeros(0, dtype=bool)
+    return np.concatenate([[True], keys[1:] != keys[:-1]]).astype(bool)
+
+
+def grouped_layout(df, group_structure):
+    """
+    그룹 헤더 시트 배치
+    (그룹 헤더 행 값 - 병합된 나머지 칸은 None, 병합 범위 [(시작 열, 끝 열)], 열 이름, 열별 값, 열별 최대 문자열 길이)
+    그룹 구조에 있지만 결과에 없는 열은 빈 값
+    """
+    group_row = []
+    merges = []
+    for group_name, group_columns in group_structure.items():
+        start = len(group_row) + 1
+        group_row += [group_name] + [None] * (len(group_columns) - 1)
+        if len(group_columns) > 1:
+            merges.append((start, len(group_row)))
+    columns = [col_name for group_columns in group_structure.values() for col_name in group_columns]
+    values = [df[col_name] if col_name in df.columns else [""] * len(df) for col_name in columns]
+    max_lengths = [
+        max(cell_length(group_name), cell_length(col_name), column_max_length(column_values))
+        for group_name, col_name, column_values in zip(group_row, columns, values)
+    ]
+    return group_row, merges, columns, values, max_lengths
+
+
+def set_column_widths(ws, max_lengths):
+    """열별 최대 문자열 길이로 열 너비 지정 (write_only 시트는 행을 쓰기 전에 지정해야 함)"""
+    for col_idx, max_length in enumerate(max_lengths, 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = column_width(max_length)
+
+
+def style_header_row(ws, max_lengths=None):
+    """
+    워크시트 헤더 행을 스타일링하는 함수
+    max_lengths: 열별 최대 문자열 길이 (DataFrame에서 미리 계산한 값, 없으면 시트를 훑어 계산)
+    """
+    register_named_styles(ws.parent)
+
+    # 첫 번째 행 (헤더): 중앙 정렬, 연한 초록색 배경, 테두리
+    for cell in ws[1]:
+        cell.style = HEADER_STYLE
+    
+    # 헤더 행 높이 조정
+    ws.row_dimensions[1].height = HEADER_ROW_HEIGHT
+    
+    # 열 너비 자동 조정 (내용에 따라)
+    if max_lengths is None:
+        max_lengths = [max(cell_length(cell.value) for cell in col) for col in ws.columns]
+    set_column_widths(ws, max_lengths)
+
+def create_grouped_headers(ws, df, group_structure, border_on_change=False):
+    """
+    워크시트에 그룹화된 헤더를 생성하는 함수
+    group_structure: {그룹명: [컬럼명 리스트]} 형태의 딕셔너리
+    border_on_change: 토지주소(첫 열) 값이 바뀌는 데이터 행(첫 데이터 행 포함)에 검은 윗 테두리
+    열 너비와 테두리 행은 DataFrame에서 미리 계산하므로 시트를 다시 훑지 않음
+    """
+    register_named_styles(ws.parent)
+    group_row, merges, columns, values, max_lengths = grouped_layout(df, group_structure)
+
+    # 첫 번째 행 - 그룹 헤더 (여러 열에 걸친 그룹은 병합, 병합된 나머지 셀은 테두리만)
+    for col_index, group_name in enumerate(group_row, 1):
+        if group_name is not None:
+            group_cell = ws.cell(row=1, column=col_index)
+            group_cell.value = group_name
+            group_cell.style = HEADER_STYLE
+    for start, end in merges:
+        ws.merge_cells(start_row=1, start_column=start, end_row=1, end_column=end)
+        for c in range(start + 1, end + 1):
+            ws.cell(row=1, column=c).style = HEADER_EDGE_STYLE
+    
+    # 두 번째 행 - 세부 헤더
+    for col_index, col_name in enumerate(columns, 1):
+        col_cell = ws.cell(row=2, column=col_index)
+        col_cell.value = col_name
+        col_cell.style = HEADER_STYLE  # 각 열 헤더에 테두리 포함
+    
+    # 데이터 추가 (3번째 행부터), 데이터 셀에도 가벼운 테두리
+    boundaries = boundary_mask(values[0]) if border_on_change and values else np.zeros(len(df), dtype=bool)
+    for row_index, (row, boundary) in enumerate(zip(zip(*values), boundaries), 3):
+        style = DATA_BOUNDARY_STYLE if boundary else DATA_STYLE
+        for col_index, value in enumerate(row, 1):
+            cell = ws.cell(row=row_index, column=col_index)
+            cell.value = value
+            cell.style = style
+    
+    # 열 너비 자동 조정 (내용에 따라)
+    set_column_widths(ws, max_lengths)
+
+
+SZJ_SHEET = "1. 소유지분현황 (갑구)"
+SYG_SHEET = "2. 소유권사항 (갑구)"
+DJG_SHEET = "3. 저당권사항 (을구)"
+
+# 소유지분현황(갑구) 그룹 헤더 구조 - "산" 열 포함
+SZJ_GROUP_STRUCTURE = {
+    "토지주소": ["토지주소", "산"],
+    "소유자": ["등기명의인", "소유구분", "(주민)등록번호", "주소", "순위번호"],
+    "토지": ["최종지분", "최종지분 수치화", "지목", "토지면적", "지분면적"]
+}
+
+DEFAULT_WRITER = "streaming"
+
+# 엑셀 시트 1개의 최대 행 수 - 이보다 많은 행은 이어지는 시트로 나눠 작성
+EXCEL_MAX_ROWS = 1_048_576
+DEFAULT_MAX_ROWS = EXCEL_MAX_ROWS
+
+
+def prepare_szj_sheet(data):
+    """소유지분현황 결과를 합쳐 "산" 열 추가·정렬, (DataFrame, 그룹 구조 또는 None) 반환"""
+    df = pd.concat(data, ignore_index=True)
+
+    # "산" 열 추가
+    df["산"] = df["토지주소"].apply(check_san_in_address)
+
+    # 열 순서 재배치 - "토지주소" 다음에 "산" 위치
+    cols = df.columns.tolist()
+    cols.remove("산")
+    idx = cols.index("토지주소")
+    cols.insert(idx + 1, "산")
+    df = df[cols]
+
+    # 토지주소 기준으로 정렬 (필터 적용 시 테두리 유지를 위해)
+    df = df.sort_values(by="토지주소", ascending=True).reset_index(drop=True)
+
+    # 소유지분현황(갑구) 시트에는 그룹 헤더 적용
+    group_structure = SZJ_GROUP_STRUCTURE if any(df["그룹정보"] == "있음") else None
+    df = df.drop(columns=["그룹정보"])  # 그룹정보 열 제거
+    return df, group_structure
+
+
+def prepare_sheet(sheetname, data):
+    """소유권사항/저당권사항 결과를 합쳐 토지주소 기준으로 정렬"""
+    df = pd.concat(data, ignore_index=True)
+    df.reset_index(drop=True, inplace=True)
+
+    # 토지주소 기준으로 정렬 (필터 적용 시 테두리 유지를 위해)
+    df = df.sort_values(by="토지주소", ascending=True).reset_index(drop=True)
+
+    if sheetname == DJG_SHEET:
+        if "순위번호" in df.columns and "등기목적" in df.columns:
+            df = df.rename(columns={"순위번호": "기록유무"})
+            # 기록유무에 등기목적 값만 표시 (등기목적이 비어있으면 "기록없음")
+            df["기록유무"] = df["등기목적"].apply(
+                lambda x: x if pd.notna(x) and str(x).strip() and str(x).strip() != "기록없음"
+                else "기록없음"
+            )
+            df = df.drop(columns=["등기목적"])
+    return df
+
+
+@dataclass
+class SheetPart:
+    """
+    작성한 시트 1개
+    source: 원래 시트 이름, sheet: 작성한 시트 이름 (이어지는 시트는 "원래 이름 (2)" ...), part: 순번(1부터)
+    rows: 데이터 행 수 (헤더 제외), first_address/last_address: 첫·마지막 토지주소
+    parcel_split: 한 토지주소의 행이 행 예산보다 많아 그 토지주소 중간에서 나눴는지
+    """
+    source: str
+    sheet: str
+    part: int = 1
+    rows: int = 0
+    first_address: str = None
+    last_address: str = None
+    parcel_split: bool = False
+
+
+def address_text(value):
+    return None if value is None or (not isinstance(value, str) and pd.isna(value)) else str(value)
+
+
+def split_rows(df, budget):
+    """
+    데이터 행을 budget행 이하 구간 [(시작, 끝, 토지주소 중간 분할 여부)]으로 나눔
+    토지주소(첫 열)가 바뀌는 행에서만 나누고, 한 토지주소의 행이 budget보다 많을 때만 그 안에서 나눔
+    """
+    n = len(df)
+    if n <= budget:
+        return [(0, n, False)]
+    parcel_starts = np.flatnonzero(boundary_mask(df.iloc[:, 0]))
+    ranges = []
+    start = 0
+    while n - start > budget:
+        limit = start + budget
+        # limit 이하에서 시작하는 마지막 토지주소 (그 앞까지가 이번 구간)
+        cut = parcel_starts[np.searchsorted(parcel_starts, limit, side="right") - 1]
+        parcel_split = bool(cut <= start)
+        if parcel_split:
+            cut = limit
+        ranges.append((start, int(cut), parcel_split))
+        start = int(cut)
+    ranges.append((start, n, False))
+    return ranges
+
+
+def sheet_tables(szj_list, syg_list, djg_list):
+    """
+    시트별 (시트 이름, 합친 DataFrame 또는 None, 그룹 구조 또는 None)
+    DataFrame이 None이면 결과가 없는 시트
+    """
+    for sheetname, data in zip([SZJ_SHEET, SYG_SHEET, DJG_SHEET], [szj_list, syg_list, djg_list]):
+        if not data:
+            yield sheetname, None, None
+        elif sheetname == SZJ_SHEET:
+            yield (sheetname, *prepare_szj_sheet(data))
+        else:
+            yield sheetname, prepare_sheet(sheetname, data), None
+
+
+def iter_sheets(szj_list, syg_list, djg_list, max_rows=DEFAULT_MAX_ROWS, data_only=False):
+    """
+    작성할 시트별 (SheetPart, DataFrame 또는 None, 그룹 구조 또는 None, 테두리 시작 행 또는 None)
+    DataFrame이 None이면 결과가 없는 시트 ("기록없음")
+    max_rows: 시트 1개의 행 예산 (헤더 포함), 넘으면 토지주소 단위로 이어지는 시트로 나눔
+    data_only: 그룹 헤더·테두리 없이 헤더 1줄로 작성할 때 (그룹 구조·테두리 시작 행은 항상 None)
+    """
+    for sheetname, df, group_structure in sheet_tables(szj_list, syg_list, djg_list):
+        if df is None:
+            yield SheetPart(sheetname, sheetname), None, None, None
+            continue
+        if data_only:
+            group_structure, header_rows, border_start_row = None, 1, None
+        elif group_structure:
+            # 그룹 헤더(2줄)면 3행부터 토지주소 변경 테두리
+            header_rows, border_start_row = 2, 3
+        elif sheetname == SZJ_SHEET:
+            # 소유지분현황 일반 헤더는 테두리 없음
+            header_rows, border_start_row = 1, None
+        else:
+            header_rows, border_start_row = 1, 2
+
+        for part, (start, end, parcel_split) in enumerate(split_rows(df, max_rows - header_rows), 1):
+            chunk = df if (start, end) == (0, len(df)) else df.iloc[start:end].reset_index(drop=True)
+            sheet_part = SheetPart(
+                sheetname, sheetname if part == 1 else f"{sheetname} ({part})", part, end - start,
+                parcel_split=parcel_split
+            )
+            if end > start:
+                sheet_part.first_address = address_text(chunk.iloc[0, 0])
+                sheet_part.last_address = address_text(chunk.iloc[-1, 0])
+            yield sheet_part, chunk, group_structure, border_start_row
+
+
+def check_max_rows(max_rows):
+    if not 3 <= max_rows <= EXCEL_MAX_ROWS:
+        raise ValueError(f"시트 행 예산은 3 ~ {EXCEL_MAX_ROWS} 사이여야 합니다: {max_rows}")
+
+
+def shard_manifest(parts, max_rows=DEFAULT_MAX_ROWS):
+    """시트가 나뉘었으면 분할 정보 {"max_rows", "sheets": [SheetPart dict]}, 아니면 None"""
+    if all(part.part == 1 for part in parts) and len(parts) == len({part.source for part in parts}):
+        return None
+    return {"max_rows": max_rows, "sheets": [asdict(part) for part in parts]}
+
+
+def write_table_rows(ws, df, border_start_row=None):
+    """
+    헤더 1줄 + 데이터 행을 쓰면서 스타일 적용 (헤더는 style_header_row와 같은 결과)
+    border_start_row: 2면 토지주소(첫 열) 값이 바뀌는 데이터 행에 윗 테두리, None이면 테두리 없음
+    """
+    register_named_styles(ws.parent)
+    rows = dataframe_to_rows(df, index=False, header=True)
+    ws.append(next(rows))
+    boundaries = boundary_mask(df.iloc[:, 0]) if border_start_row and df.shape[1] else np.zeros(len(df), dtype=bool)
+    for row_index, (row, boundary) in enumerate(zip(rows, boundaries), 2):
+        ws.append(row)
+        if boundary:
+            for col_index in range(1, len(row) + 1):
+                ws.cell(row=row_index, column=col_index).style = BOUNDARY_STYLE
+    style_header_row(ws, table_max_lengths(df))
+
+
+def table_max_lengths(df):
+    """헤더 1줄 시트의 열별 최대 문자열 길이 (열 이름 포함)"""
+    return [max(cell_length(name), column_max_length(df.iloc[:, col_idx])) for col_idx, name in enumerate(df.columns)]
+
+
+def write_workbook_openpyxl(szj_list, syg_list, djg_list, path, max_rows=DEFAULT_MAX_ROWS):
+    """
+    파일별 결과 목록을 시트 3개(소유지분현황/소유권사항/저당권사항)로 합쳐 path에 저장
+    작성한 시트 목록(SheetPart)을 반환
+    """
+    wb = Workbook()
+    register_named_styles(wb)
+    parts = []
+    for part, df, group_structure, border_start_row in iter_sheets(szj_list, syg_list, djg_list, max_rows):
+        parts.append(part)
+        ws = wb.create_sheet(title=part.sheet)
+        if df is None:
+            ws.append(["기록없음"])
+            # 데이터가 없는 경우에도 헤더 스타일 적용
+            style_header_row(ws)
+        elif group_structure:
+            create_grouped_headers(ws, df, group_structure, border_on_change=bool(border_start_row))
+        else:
+            write_table_rows(ws, df, border_start_row)
+
+    wb.remove(wb["Sheet"])
+    wb.save(path)
+    return parts
+
+
+def cell_style(ws, name):
+    """
+    이름 있는 스타일의 스타일 값(StyleArray)
+    셀마다 이름으로 스타일 목록을 찾지 않도록 시트마다 한 번 만들어 둠
+    """
+    cell = WriteOnlyCell(ws)
+    cell.style = name
+    return cell._style
+
+
+def styled_cell(ws, value, style):
+    cell = WriteOnlyCell(ws, value=value)
+    # 작성 후 바로 버려지는 셀이므로 같은 스타일 값을 복사 없이 함께 씀
+    cell._style = style
+    return cell
+
+
+def stream_table_sheet(ws, df, border_start_row=None):
+    """
+    헤더 1줄 + 데이터 행 시트 (write_table_rows와 같은 결과)
+    border_start_row: 2면 데이터 첫 행부터 토지주소(첫 열) 값이 바뀌는 행에 윗 테두리, None이면 테두리 없음
+    """
+    set_column_widths(ws, table_max_lengths(df))
+    ws.row_dimensions[1].height = HEADER_ROW_HEIGHT
+    header_style = cell_style(ws, HEADER_STYLE)
+    ws.append([styled_cell(ws, name, header_style) for name in df.columns])
+
+    top_style = cell_style(ws, BOUNDARY_STYLE)
+    boundaries = boundary_mask(df.iloc[:, 0]) if border_start_row and df.shape[1] else np.zeros(len(df), dtype=bool)
+    for row, boundary in zip(df.itertuples(index=False), boundaries):
+        ws.append([styled_cell(ws, value, top_style) for value in row] if boundary else list(row))
+
+
+def stream_grouped_sheet(ws, df, group_structure):
+    """그룹 헤더 2줄 + 데이터 행 시트 (create_grouped_headers(border_on_change=True)와 같은 결과)"""
+    group_row, merges, columns, values, max_lengths = grouped_layout(df, group_structure)
+    set_column_widths(ws, max_lengths)
+    for start, end in merges:
+        ws.merged_cells.add(f"{get_column_letter(start)}1:{get_column_letter(end)}1")
+
+    header_style = cell_style(ws, HEADER_STYLE)
+    edge_style = cell_style(ws, HEADER_EDGE_STYLE)
+    # 병합 범위의 나머지 셀은 테두리만
+    ws.append([styled_cell(ws, name, header_style if name is not None else edge_style) for name in group_row])
+    ws.append([styled_cell(ws, col_name, header_style) for col_name in columns])
+
+    data_style = cell_style(ws, DATA_STYLE)
+    data_top_style = cell_style(ws, DATA_BOUNDARY_STYLE)
+    boundaries = boundary_mask(values[0]) if values else np.zeros(len(df), dtype=bool)
+    for row, boundary in zip(zip(*values), boundaries):
+        style = data_top_style if boundary else data_style
+        ws.append([styled_cell(ws, value, style) for value in row])
+
+
+def write_workbook_streaming(szj_list, syg_list, djg_list, path, max_rows=DEFAULT_MAX_ROWS):
+    """write_workbook_openpyxl과 같은 워크북을 write_only 모드로 행 단위로 작성"""
+    wb = Workbook(write_only=True)
+    register_named_styles(wb)
+    parts = []
+    for part, df, group_structure, border_start_row in iter_sheets(szj_list, syg_list, djg_list, max_rows):
+        parts.append(part)
+        ws = wb.create_sheet(title=part.sheet)
+        if df is None:
+            # 데이터가 없는 경우에도 헤더 스타일 적용
+            stream_table_sheet(ws, pd.DataFrame(columns=["기록없음"]))
+        elif group_structure:
+            stream_grouped_sheet(ws, df, group_structure)
+        else:
+            stream_table_sheet(ws, df, border_start_row)
+    wb.save(path)
+    return parts
+
+
+def write_workbook_data_only(szj_list, syg_list, djg_list, path, max_rows=DEFAULT_MAX_ROWS):
+    """
+    서식 없이 값만 write_only 모드로 작성 (헤더 1줄 + 데이터 행)
+    그룹 헤더·토지주소 변경 테두리·열 너비 계산을 모두 건너뜀
+    """
+    wb = Workbook(write_only=True)
+    parts = []
+    for part, df, _, _ in iter_sheets(szj_list, syg_list, djg_list, max_rows, data_only=True):
+        parts.append(part)
+        ws = wb.create_sheet(title=part.sheet)
+        if df is None:
+            df = pd.DataFrame(columns=["기록없음"])
+        ws.append(list(df.columns))
+        for row in df.itertuples(index=False):
+            ws.append(list(row))
+    wb.save(path)
+    return parts
+
+
+# 서식 없이 값만 작성하는 방식 (다른 방식과 결과 워크북이 다름)
+DATA_ONLY_WRITER = "data-only"
+
+WRITERS = {
+    "openpyxl": write_workbook_openpyxl,
+    "streaming": write_workbook_streaming,
+    DATA_ONLY_WRITER: write_workbook_data_only,
+}
+
+
+def write_workbook(szj_list, syg_list, djg_list, path, writer=DEFAULT_WRITER, max_rows=DEFAULT_MAX_ROWS):
+    """
+    파일별 결과 목록을 시트 3개(소유지분현황/소유권사항/저당권사항)로 합쳐 path에 저장
+    writer: 작성 방식 이름 (WRITERS 키)
+    max_rows: 시트 1개의 행 예산 (헤더 포함, 기본: 엑셀 최대 행 수)
+      넘는 시트는 같은 토지주소의 행이 한 시트에 모이도록 "시트 이름 (2)" ... 이어지는 시트로 나눔
+    작성한 시트 목록(SheetPart)을 반환
+    """
+    if writer not in WRITERS:
+        raise ValueError(f"알 수 없는 작성 방식: {writer} (사용 가능: {', '.join(WRITERS)})")
+    check_max_rows(max_rows)
+    return WRITERS[writer](szj_list, syg_list, djg_list, path, max_rows=max_rows)